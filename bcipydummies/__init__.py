@@ -23,58 +23,81 @@ Or use the factory for configuration-driven setup:
 
 __version__ = "0.2.0"
 
-# Core classes
-from .core.engine import BCIPipeline
-from .core.config import Config, ThresholdConfig, KeyboardConfig, EmotivConfig
-from .core.events import EEGEvent, MentalCommandEvent, ConnectionEvent, MentalCommand
-from .core.exceptions import (
-    BCIError,
-    ConnectionError,
-    ConfigurationError,
-    DeviceNotFoundError,
-    WindowNotFoundError,
-)
-from .core.factory import (
-    create_pipeline,
-    create_pipeline_from_yaml,
-    create_pipeline_from_env,
-    create_source,
-    create_processors,
-    create_publishers,
-)
+import importlib
 
-# Sources
-from .sources.base import EEGSource
-from .sources.mock import MockSource
+# Public names resolved on first access (PEP 562), mapped to the submodule
+# that defines them. Keeps ``import bcipydummies`` (and the CLI) from loading
+# the whole pipeline and its dependencies up front.
+_LAZY_IMPORTS = {
+    # Core classes
+    "BCIPipeline": ".core.engine",
+    "Config": ".core.config",
+    "ThresholdConfig": ".core.config",
+    "KeyboardConfig": ".core.config",
+    "EmotivConfig": ".core.config",
+    "EEGEvent": ".core.events",
+    "MentalCommandEvent": ".core.events",
+    "ConnectionEvent": ".core.events",
+    "MentalCommand": ".core.events",
+    "BCIError": ".core.exceptions",
+    "ConnectionError": ".core.exceptions",
+    "ConfigurationError": ".core.exceptions",
+    "DeviceNotFoundError": ".core.exceptions",
+    "WindowNotFoundError": ".core.exceptions",
+    "create_pipeline": ".core.factory",
+    "create_pipeline_from_yaml": ".core.factory",
+    "create_pipeline_from_env": ".core.factory",
+    "create_source": ".core.factory",
+    "create_processors": ".core.factory",
+    "create_publishers": ".core.factory",
+    # Sources
+    "EEGSource": ".sources.base",
+    "MockSource": ".sources.mock",
+    # Processors
+    "Processor": ".processors.base",
+    "ThresholdProcessor": ".processors.threshold",
+    "DebounceProcessor": ".processors.debounce",
+    "CommandMapper": ".processors.mapper",
+    # Publishers
+    "Publisher": ".publishers.base",
+    "ConsolePublisher": ".publishers.console",
+    # Keyboard publisher (may not be available on non-Windows)
+    "KeyboardPublisher": ".publishers.keyboard",
+    "create_keyboard_publisher": ".publishers.keyboard",
+    # Emotiv source (may not be available if websocket not installed)
+    "EmotivSource": ".sources.emotiv",
+    # Legacy controller (deprecated, for backwards compatibility)
+    "EmotivController": ".emotiv_controller",
+}
+
+# Names whose modules depend on optional packages. These resolve to None
+# when their dependencies are missing instead of raising ImportError.
+_OPTIONAL_IMPORTS = frozenset({
+    "KeyboardPublisher",
+    "create_keyboard_publisher",
+    "EmotivSource",
+    "EmotivController",
+})
 
-# Processors
-from .processors.base import Processor
-from .processors.threshold import ThresholdProcessor
-from .processors.debounce import DebounceProcessor
-from .processors.mapper import CommandMapper
 
-# Publishers
-from .publishers.base import Publisher
-from .publishers.console import ConsolePublisher
+def __getattr__(name: str):
+    """Lazy loading for the public API."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    except ImportError:
+        if name not in _OPTIONAL_IMPORTS:
+            raise
+        value = None
+    globals()[name] = value
+    return value
 
-# Keyboard publisher (may not be available on non-Windows)
-try:
-    from .publishers.keyboard import KeyboardPublisher, create_keyboard_publisher
-except ImportError:
-    KeyboardPublisher = None
-    create_keyboard_publisher = None
 
-# Emotiv source (may not be available if websocket not installed)
-try:
-    from .sources.emotiv import EmotivSource
-except ImportError:
-    EmotivSource = None
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-# Legacy controller (deprecated, for backwards compatibility)
-try:
-    from .emotiv_controller import EmotivController
-except ImportError:
-    EmotivController = None
 
 __all__ = [
     # Version
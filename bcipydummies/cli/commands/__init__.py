@@ -4,9 +4,30 @@ CLI command implementations.
 Each command is implemented as a separate module with a consistent interface.
 """
 
-from .base import BaseCommand
-from .run import RunCommand
-from .list_windows import ListWindowsCommand
-from .list_headsets import ListHeadsetsCommand
+import importlib
+
+# Command classes resolved on first access (PEP 562), so running one command
+# (or just ``--help``/``--version``) does not import the others.
+_LAZY_IMPORTS = {
+    "BaseCommand": ".base",
+    "RunCommand": ".run",
+    "ListWindowsCommand": ".list_windows",
+    "ListHeadsetsCommand": ".list_headsets",
+}
+
+
+def __getattr__(name: str):
+    """Lazy loading for the command classes."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = ["BaseCommand", "RunCommand", "ListWindowsCommand", "ListHeadsetsCommand"]
@@ -6,6 +6,7 @@ Provides common interface and utilities for all commands.
 
 from abc import ABC, abstractmethod
 import argparse
+import sys
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -17,8 +18,14 @@ class BaseCommand(ABC):
     Abstract base class for CLI commands.
 
     All commands should inherit from this class and implement the execute method.
+
+    Attributes:
+        cli: The parent CLI instance. Commands check
+             ``self.cli.shutdown_requested`` to stop long-running work.
     """
 
+    __slots__ = ("cli",)
+
     def __init__(self, cli: "CLI"):
         """
         Initialize the command.
@@ -26,17 +33,7 @@ class BaseCommand(ABC):
         Args:
             cli: The parent CLI instance.
         """
-        self._cli = cli
-
-    @property
-    def cli(self) -> "CLI":
-        """Get the parent CLI instance."""
-        return self._cli
-
-    @property
-    def shutdown_requested(self) -> bool:
-        """Check if shutdown was requested."""
-        return self._cli.shutdown_requested
+        self.cli = cli
 
     @abstractmethod
     def execute(self, args: argparse.Namespace) -> int:
@@ -72,5 +69,4 @@ class BaseCommand(ABC):
         Args:
             message: The error message.
         """
-        import sys
-        print(f"Error: {message}", file=sys.stderr)
+        sys.stderr.write(f"Error: {message}\n")
@@ -5,7 +5,9 @@ Lists available Emotiv headsets.
 """
 
 import argparse
-from typing import List, Dict, Any
+import functools
+import sys
+from typing import Any, Callable, Dict, List, Optional
 
 from .base import BaseCommand
 
@@ -13,6 +15,8 @@ from .base import BaseCommand
 class ListHeadsetsCommand(BaseCommand):
     """Command to list available Emotiv headsets."""
 
+    __slots__ = ()
+
     def execute(self, args: argparse.Namespace) -> int:
         """
         Execute the list-headsets command.
@@ -53,18 +57,12 @@ class ListHeadsetsCommand(BaseCommand):
         Raises:
             ConnectionError: If cannot connect to Emotiv service.
         """
-        try:
-            from ...sources.emotiv import EmotivSource
-        except ImportError:
-            # EmotivSource not yet implemented, return placeholder
+        discover_headsets = _resolve_headset_backend()
+        if discover_headsets is None:
+            # EmotivSource not available or discovery not implemented yet
             return self._get_headsets_placeholder()
 
-        try:
-            # Attempt to query available headsets
-            return EmotivSource.discover_headsets()
-        except AttributeError:
-            # Method not implemented yet
-            return self._get_headsets_placeholder()
+        return discover_headsets()
 
     def _get_headsets_placeholder(self) -> List[Dict[str, Any]]:
         """
@@ -94,7 +92,7 @@ class ListHeadsetsCommand(BaseCommand):
         Args:
             headsets: List of headset information dictionaries.
         """
-        print(f"Found {len(headsets)} headset(s):\n")
+        lines = [f"Found {len(headsets)} headset(s):\n\n"]
 
         for headset in headsets:
             headset_id = headset.get("id", "Unknown")
@@ -103,12 +101,31 @@ class ListHeadsetsCommand(BaseCommand):
             battery = headset.get("battery")
             signal = headset.get("signal_quality", "unknown")
 
-            print(f"  {name}")
-            print(f"    ID: {headset_id}")
-            print(f"    Status: {status}")
+            lines.append(f"  {name}\n")
+            lines.append(f"    ID: {headset_id}\n")
+            lines.append(f"    Status: {status}\n")
 
             if battery is not None:
-                print(f"    Battery: {battery}%")
+                lines.append(f"    Battery: {battery}%\n")
+
+            lines.append(f"    Signal Quality: {signal}\n")
+            lines.append("\n")
+
+        # Write the whole listing at once rather than one print() per field
+        sys.stdout.write("".join(lines))
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_headset_backend() -> Optional[Callable[[], List[Dict[str, Any]]]]:
+    """
+    Resolve the headset discovery function once per process.
+
+    Returns:
+        EmotivSource.discover_headsets if available, otherwise None.
+    """
+    try:
+        from ...sources.emotiv import EmotivSource
+    except ImportError:
+        return None
 
-            print(f"    Signal Quality: {signal}")
-            print()
+    return getattr(EmotivSource, "discover_headsets", None)
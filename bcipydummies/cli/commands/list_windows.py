@@ -6,15 +6,63 @@ Lists available windows that can be targeted for keyboard output.
 
 import argparse
 import fnmatch
+import functools
+import re
 import sys
-from typing import List, Optional, Tuple
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
 
 from .base import BaseCommand
 
+# Maximum window title length read per window on Windows
+_TITLE_BUFFER_SIZE = 512
+
+# Maximum window class name length on Windows
+_CLASS_BUFFER_SIZE = 256
+
+# Desktop shell window classes that are never useful keyboard targets
+_SKIPPED_WINDOW_CLASSES = frozenset({"Progman", "WorkerW"})
+
+# Characters that make a --filter pattern a glob rather than plain text
+_GLOB_CHARS = "*?["
+
+# One line of `wmctrl -l` output: window id, desktop, host, then the title
+_WMCTRL_LINE = re.compile(rb"(\S+)\s+\S+\s+\S+\s+(\S.*)")
+
+# Prints one line per window id given as an argument, empty if the
+# window name cannot be read. The shell still runs one xdotool process per
+# window; only the per-window spawn from Python is saved.
+_XDOTOOL_NAMES_SCRIPT = 'for id; do xdotool getwindowname "$id" 2>/dev/null || echo; done'
+
+# Timeout for a single `xdotool getwindowname`, used for the windows left
+# over when the batched lookup times out
+_XDOTOOL_NAME_TIMEOUT = 2
+
+# Walks the foreground processes once, pairing each process name with its
+# own window names so the two can never drift apart, collects the
+# "process: window" entries in a list and joins them with linefeeds in a
+# single coercion (one entry per line, so titles may safely contain commas)
+_APPLESCRIPT_WINDOWS = '''
+set entries to {}
+tell application "System Events"
+    repeat with proc in (every process whose background only is false)
+        set procName to name of proc
+        repeat with winName in (name of every window of proc)
+            if contents of winName is not missing value then
+                set end of entries to procName & ": " & (contents of winName)
+            end if
+        end repeat
+    end repeat
+end tell
+set AppleScript's text item delimiters to linefeed
+return entries as text
+'''
+
 
 class ListWindowsCommand(BaseCommand):
     """Command to list available windows."""
 
+    __slots__ = ()
+
     def execute(self, args: argparse.Namespace) -> int:
         """
         Execute the list-windows command.
@@ -29,6 +77,10 @@ class ListWindowsCommand(BaseCommand):
 
         try:
             windows = self._get_windows()
+
+            # Apply filter if specified, streaming the backend's results
+            if filter_pattern:
+                windows = list(self._filter_windows(windows, filter_pattern))
         except NotImplementedError as e:
             self.error(str(e))
             return 1
@@ -36,10 +88,6 @@ class ListWindowsCommand(BaseCommand):
             self.error(f"Failed to enumerate windows: {e}")
             return 1
 
-        # Apply filter if specified
-        if filter_pattern:
-            windows = self._filter_windows(windows, filter_pattern)
-
         # Display results
         if not windows:
             if filter_pattern:
@@ -55,71 +103,86 @@ class ListWindowsCommand(BaseCommand):
         """
         Get list of available windows.
 
+        The backends build lists rather than yielding: the win32
+        EnumWindows callback cannot yield, the Quartz and xlib backends
+        need the whole result to decide whether to fall back, subprocess
+        output is captured in one piece under a timeout, and
+        _print_windows needs the count and ID column width up front.
+        Filtering is streamed over the list instead.
+
         Returns:
             List of (window_id, window_title) tuples.
 
         Raises:
             NotImplementedError: If platform is not supported.
         """
-        platform = sys.platform
-
-        if platform == "win32":
-            return self._get_windows_win32()
-        elif platform == "darwin":
-            return self._get_windows_macos()
-        elif platform.startswith("linux"):
-            return self._get_windows_linux()
-        else:
-            raise NotImplementedError(
-                f"Window enumeration not supported on platform: {platform}"
-            )
+        return _resolve_window_backend()(self)
 
     def _get_windows_win32(self) -> List[Tuple[str, str]]:
-        """Get windows on Windows platform."""
-        try:
-            import win32gui
-        except ImportError:
-            raise NotImplementedError(
-                "pywin32 is required for window enumeration on Windows. "
-                "Install it with: pip install pywin32"
-            )
+        """Get windows on Windows platform.
+
+        Calls user32 directly through ctypes rather than going through the
+        pywin32 wrappers, reusing a single title buffer for the whole
+        enumeration.
+        """
+        import ctypes
+        from ctypes import wintypes
+
+        user32 = ctypes.WinDLL("user32", use_last_error=True)
+        wndenumproc = ctypes.WINFUNCTYPE(
+            wintypes.BOOL, wintypes.HWND, wintypes.LPARAM
+        )
+
+        # Declare prototypes so HWNDs are passed as pointers; the default
+        # int conversion would truncate them on 64-bit Windows
+        enum_windows = user32.EnumWindows
+        enum_windows.argtypes = [wndenumproc, wintypes.LPARAM]
+        enum_windows.restype = wintypes.BOOL
+
+        is_window_visible = user32.IsWindowVisible
+        is_window_visible.argtypes = [wintypes.HWND]
+        is_window_visible.restype = wintypes.BOOL
+
+        get_class_name = user32.GetClassNameW
+        get_class_name.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+        get_class_name.restype = ctypes.c_int
+
+        get_window_text = user32.GetWindowTextW
+        get_window_text.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+        get_window_text.restype = ctypes.c_int
 
+        class_buffer = ctypes.create_unicode_buffer(_CLASS_BUFFER_SIZE)
+        buffer = ctypes.create_unicode_buffer(_TITLE_BUFFER_SIZE)
         windows = []
 
-        def enum_callback(hwnd, results):
-            if win32gui.IsWindowVisible(hwnd):
-                title = win32gui.GetWindowText(hwnd)
-                if title:  # Skip windows without titles
-                    results.append((str(hwnd), title))
+        def enum_callback(hwnd, _):
+            if not is_window_visible(hwnd):
+                return True
+            # Skip desktop shell windows without reading their titles
+            get_class_name(hwnd, class_buffer, _CLASS_BUFFER_SIZE)
+            if class_buffer.value in _SKIPPED_WINDOW_CLASSES:
+                return True
+            # GetWindowTextW returns 0 for windows without titles
+            if get_window_text(hwnd, buffer, _TITLE_BUFFER_SIZE):
+                windows.append((str(hwnd), buffer.value))
             return True
 
-        win32gui.EnumWindows(enum_callback, windows)
+        enum_windows(wndenumproc(enum_callback), 0)
         return windows
 
     def _get_windows_macos(self) -> List[Tuple[str, str]]:
         """Get windows on macOS platform."""
         import subprocess
 
-        try:
-            # Use AppleScript to get window list
-            script = '''
-            tell application "System Events"
-                set windowList to {}
-                repeat with proc in (every process whose background only is false)
-                    set procName to name of proc
-                    repeat with win in (every window of proc)
-                        set winName to name of win
-                        set end of windowList to procName & ": " & winName
-                    end repeat
-                end repeat
-                return windowList
-            end tell
-            '''
+        # Prefer Quartz: an in-process query, no osascript startup cost
+        windows = self._get_windows_quartz()
+        if windows is not None:
+            return windows
 
+        try:
             result = subprocess.run(
-                ["osascript", "-e", script],
+                ["osascript", "-e", _APPLESCRIPT_WINDOWS],
                 capture_output=True,
-                text=True,
                 timeout=10,
             )
 
@@ -127,17 +190,12 @@ class ListWindowsCommand(BaseCommand):
                 # Fall back to listing applications
                 return self._get_apps_macos()
 
-            # Parse the output
-            windows = []
-            output = result.stdout.strip()
-
-            if output:
-                # AppleScript returns comma-separated list
-                items = output.split(", ")
-                for i, item in enumerate(items):
-                    windows.append((str(i), item))
-
-            return windows
+            # One "process: window" entry per line
+            output = result.stdout.decode("utf-8", "replace")
+            return [
+                (str(i), item)
+                for i, item in enumerate(line for line in output.splitlines() if line)
+            ]
 
         except subprocess.TimeoutExpired:
             return self._get_apps_macos()
@@ -146,6 +204,37 @@ class ListWindowsCommand(BaseCommand):
                 "osascript not found. Cannot enumerate windows on this system."
             )
 
+    def _get_windows_quartz(self) -> Optional[List[Tuple[str, str]]]:
+        """Get on-screen windows on macOS via CGWindowListCopyWindowInfo.
+
+        Returns:
+            List of (window_id, window_title) tuples, or None if
+            pyobjc-framework-Quartz is not installed or no window exposes
+            a title. On macOS 10.15+ titles are withheld without the
+            Screen Recording permission, so None lets the caller fall back
+            to AppleScript.
+        """
+        try:
+            from Quartz import (
+                CGWindowListCopyWindowInfo,
+                kCGNullWindowID,
+                kCGWindowListOptionOnScreenOnly,
+            )
+        except ImportError:
+            return None
+
+        infos = CGWindowListCopyWindowInfo(
+            kCGWindowListOptionOnScreenOnly, kCGNullWindowID
+        )
+
+        windows = []
+        for info in infos or ():
+            title = info.get("kCGWindowName")
+            if title:  # Skip windows without titles
+                owner = info.get("kCGWindowOwnerName", "")
+                windows.append((str(info["kCGWindowNumber"]), f"{owner}: {title}"))
+        return windows or None
+
     def _get_apps_macos(self) -> List[Tuple[str, str]]:
         """Get running applications on macOS as fallback."""
         import subprocess
@@ -160,13 +249,12 @@ class ListWindowsCommand(BaseCommand):
         result = subprocess.run(
             ["osascript", "-e", script],
             capture_output=True,
-            text=True,
             timeout=10,
         )
 
         apps = []
         if result.returncode == 0:
-            output = result.stdout.strip()
+            output = result.stdout.decode("utf-8", "replace").strip()
             if output:
                 items = output.split(", ")
                 for i, item in enumerate(items):
@@ -178,24 +266,29 @@ class ListWindowsCommand(BaseCommand):
         """Get windows on Linux platform."""
         import subprocess
 
+        # Prefer python-xlib: a single X connection, no subprocesses
+        windows = self._get_windows_xlib()
+        if windows is not None:
+            return windows
+
         try:
             # Try using wmctrl
             result = subprocess.run(
                 ["wmctrl", "-l"],
                 capture_output=True,
-                text=True,
                 timeout=10,
             )
 
             if result.returncode == 0:
                 windows = []
-                for line in result.stdout.strip().split("\n"):
-                    if line:
-                        parts = line.split(None, 3)
-                        if len(parts) >= 4:
-                            window_id = parts[0]
-                            title = parts[3]
-                            windows.append((window_id, title))
+                for line in result.stdout.splitlines():
+                    match = _WMCTRL_LINE.match(line)
+                    if match:
+                        window_id, title = match.groups()
+                        windows.append((
+                            window_id.decode("ascii"),
+                            title.decode("utf-8", "replace"),
+                        ))
                 return windows
 
         except FileNotFoundError:
@@ -208,24 +301,13 @@ class ListWindowsCommand(BaseCommand):
             result = subprocess.run(
                 ["xdotool", "search", "--name", ""],
                 capture_output=True,
-                text=True,
                 timeout=10,
             )
 
             if result.returncode == 0:
-                windows = []
-                for window_id in result.stdout.strip().split("\n"):
-                    if window_id:
-                        # Get window title
-                        name_result = subprocess.run(
-                            ["xdotool", "getwindowname", window_id],
-                            capture_output=True,
-                            text=True,
-                            timeout=5,
-                        )
-                        title = name_result.stdout.strip() if name_result.returncode == 0 else "Unknown"
-                        windows.append((window_id, title))
-                return windows
+                window_ids = result.stdout.decode("ascii", "replace").split()
+                titles = self._get_window_names_xdotool(window_ids)
+                return list(zip(window_ids, titles))
 
         except FileNotFoundError:
             raise NotImplementedError(
@@ -238,26 +320,145 @@ class ListWindowsCommand(BaseCommand):
 
         return []
 
+    def _get_windows_xlib(self) -> Optional[List[Tuple[str, str]]]:
+        """Get windows on Linux by reading the EWMH client list via python-xlib.
+
+        Returns:
+            List of (window_id, window_title) tuples, or None if python-xlib
+            is not installed, no X display is available, or the window
+            manager does not publish _NET_CLIENT_LIST.
+        """
+        try:
+            from Xlib import Xatom, display
+        except ImportError:
+            return None
+
+        try:
+            x_display = display.Display()
+        except Exception:
+            return None
+
+        try:
+            root = x_display.screen().root
+            client_list = root.get_full_property(
+                x_display.intern_atom("_NET_CLIENT_LIST"), Xatom.WINDOW
+            )
+            if client_list is None:
+                return None
+
+            net_wm_name = x_display.intern_atom("_NET_WM_NAME")
+            windows = []
+            for wid in client_list.value:
+                window = x_display.create_resource_object("window", wid)
+                name = window.get_full_property(net_wm_name, 0)
+                title = name.value if name is not None else window.get_wm_name()
+                if isinstance(title, bytes):
+                    title = title.decode("utf-8", "replace")
+                # Match the id format printed by wmctrl
+                windows.append((f"0x{wid:08x}", title or ""))
+            return windows
+        except Exception:
+            return None
+        finally:
+            x_display.close()
+
+    def _get_window_names_xdotool(self, window_ids: List[str]) -> List[str]:
+        """
+        Look up window titles for several xdotool window ids at once.
+
+        Python spawns a single shell for all ids, which then runs
+        ``xdotool getwindowname`` once per window. That removes the
+        per-window Python subprocess setup, not the per-window xdotool
+        process. A failed lookup prints an empty line, so output lines
+        stay aligned with the ids. If the batch times out, the names it
+        already printed are kept and the remaining windows are looked up
+        one by one, so a single unresponsive window only loses its own name.
+
+        Args:
+            window_ids: Window ids as printed by ``xdotool search``.
+
+        Returns:
+            Window titles in the same order as window_ids, with "Unknown"
+            for windows whose name could not be read.
+        """
+        import subprocess
+
+        if not window_ids:
+            return []
+
+        try:
+            result = subprocess.run(
+                ["sh", "-c", _XDOTOOL_NAMES_SCRIPT, "sh", *window_ids],
+                capture_output=True,
+                timeout=10,
+            )
+        except subprocess.TimeoutExpired as e:
+            # Only complete lines are reliable; the last one may be cut off
+            output = (e.stdout or b"").decode("utf-8", "replace")
+            titles = output.split("\n")[:-1][:len(window_ids)]
+            titles.extend(
+                self._get_window_name_xdotool(window_id)
+                for window_id in window_ids[len(titles):]
+            )
+        else:
+            titles = result.stdout.decode("utf-8", "replace").split("\n")[:len(window_ids)]
+            titles.extend([""] * (len(window_ids) - len(titles)))
+        return [title or "Unknown" for title in titles]
+
+    def _get_window_name_xdotool(self, window_id: str) -> str:
+        """
+        Look up a single window title with ``xdotool getwindowname``.
+
+        Args:
+            window_id: Window id as printed by ``xdotool search``.
+
+        Returns:
+            The window title, or an empty string if it could not be read.
+        """
+        import subprocess
+
+        try:
+            result = subprocess.run(
+                ["xdotool", "getwindowname", window_id],
+                capture_output=True,
+                timeout=_XDOTOOL_NAME_TIMEOUT,
+            )
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            return ""
+
+        if result.returncode != 0:
+            return ""
+        return result.stdout.decode("utf-8", "replace").rstrip("\n")
+
     def _filter_windows(
-        self, windows: List[Tuple[str, str]], pattern: str
-    ) -> List[Tuple[str, str]]:
+        self, windows: Iterable[Tuple[str, str]], pattern: str
+    ) -> Iterator[Tuple[str, str]]:
         """
         Filter windows by name pattern.
 
         Args:
-            windows: List of (window_id, window_title) tuples.
+            windows: Iterable of (window_id, window_title) tuples.
             pattern: Glob pattern to match against window titles.
 
         Returns:
-            Filtered list of windows.
+            Iterator over the matching windows.
         """
-        pattern_lower = pattern.lower()
+        if not any(char in pattern for char in _GLOB_CHARS):
+            # Plain text: a substring check is equivalent to "*pattern*"
+            needle = pattern.lower()
+            return (
+                (wid, title)
+                for wid, title in windows
+                if needle in title.lower()
+            )
+
+        regex = re.compile(fnmatch.translate(f"*{pattern}*"), re.IGNORECASE)
 
-        return [
+        return (
             (wid, title)
             for wid, title in windows
-            if fnmatch.fnmatch(title.lower(), f"*{pattern_lower}*")
-        ]
+            if regex.match(title)
+        )
 
     def _print_windows(self, windows: List[Tuple[str, str]]) -> None:
         """
@@ -266,18 +467,52 @@ class ListWindowsCommand(BaseCommand):
         Args:
             windows: List of (window_id, window_title) tuples.
         """
-        print(f"Found {len(windows)} window(s):\n")
+        # Size the ID column and truncate long titles in a single pass
+        id_width = 2  # Minimum width for "ID" header
+        rows = []
+        for window_id, title in windows:
+            if len(window_id) > id_width:
+                id_width = len(window_id)
+            display_title = title if len(title) <= 60 else title[:57] + "..."
+            rows.append((window_id, display_title))
 
-        # Calculate column widths
-        id_width = max(len(wid) for wid, _ in windows)
-        id_width = max(id_width, 2)  # Minimum width for "ID" header
+        lines = [
+            f"Found {len(windows)} window(s):\n\n",
+            f"{'ID':<{id_width}}  Title\n",
+            f"{'-' * id_width}  {'-' * 50}\n",
+        ]
+        lines.extend(
+            f"{window_id:<{id_width}}  {display_title}\n"
+            for window_id, display_title in rows
+        )
 
-        # Print header
-        print(f"{'ID':<{id_width}}  Title")
-        print(f"{'-' * id_width}  {'-' * 50}")
+        # Write the whole table at once rather than one print() per row
+        sys.stdout.write("".join(lines))
 
-        # Print windows
-        for window_id, title in windows:
-            # Truncate long titles
-            display_title = title if len(title) <= 60 else title[:57] + "..."
-            print(f"{window_id:<{id_width}}  {display_title}")
+
+@functools.lru_cache(maxsize=1)
+def _resolve_window_backend() -> Callable[[ListWindowsCommand], List[Tuple[str, str]]]:
+    """
+    Select the window enumeration backend for the current platform.
+
+    The result is cached, so the platform dispatch only happens once per
+    process.
+
+    Returns:
+        The unbound ListWindowsCommand method that enumerates windows.
+
+    Raises:
+        NotImplementedError: If platform is not supported.
+    """
+    platform = sys.platform
+
+    if platform == "win32":
+        return ListWindowsCommand._get_windows_win32
+    elif platform == "darwin":
+        return ListWindowsCommand._get_windows_macos
+    elif platform.startswith("linux"):
+        return ListWindowsCommand._get_windows_linux
+    else:
+        raise NotImplementedError(
+            f"Window enumeration not supported on platform: {platform}"
+        )
@@ -5,16 +5,21 @@ Starts the BCI pipeline with the specified configuration.
 """
 
 import argparse
+import re
 import sys
-import time
 from typing import Dict, List, Optional, Tuple
 
 from .base import BaseCommand
 
+# "key:value" split on the first colon, with surrounding whitespace trimmed
+_PAIR_RE = re.compile(r"\s*([^:]*?)\s*:\s*(.*?)\s*", re.DOTALL)
+
 
 class RunCommand(BaseCommand):
     """Command to start the BCI pipeline."""
 
+    __slots__ = ()
+
     def execute(self, args: argparse.Namespace) -> int:
         """
         Execute the run command.
@@ -65,10 +70,7 @@ class RunCommand(BaseCommand):
             "source": {
                 "type": args.source,
             },
-            "processors": {
-                "thresholds": {},
-                "mappings": {},
-            },
+            "processors": {},
             "publishers": [],
         }
 
@@ -77,6 +79,11 @@ class RunCommand(BaseCommand):
             file_config = self._load_config_file(args.config)
             config = self._merge_configs(config, file_config)
 
+        # Only create the processor tables the config file did not provide
+        processors = config.setdefault("processors", {})
+        processors.setdefault("thresholds", {})
+        processors.setdefault("mappings", {})
+
         # Parse command mappings
         if args.mappings:
             mappings = self._parse_key_value_pairs(args.mappings, "mapping")
@@ -123,18 +130,25 @@ class RunCommand(BaseCommand):
             raise ValueError(f"Configuration file not found: {path}")
 
         try:
-            with open(config_path, "r") as f:
-                if config_path.suffix in (".yaml", ".yml"):
-                    try:
-                        import yaml
-                        return yaml.safe_load(f)
-                    except ImportError:
-                        raise ValueError(
-                            "PyYAML is required to load YAML config files. "
-                            "Install it with: pip install pyyaml"
-                        )
-                else:
-                    return json.load(f)
+            raw = config_path.read_bytes()
+            if config_path.suffix in (".yaml", ".yml"):
+                try:
+                    import yaml
+                except ImportError:
+                    raise ValueError(
+                        "PyYAML is required to load YAML config files. "
+                        "Install it with: pip install pyyaml"
+                    )
+                # Use the libyaml bindings when PyYAML was built with them
+                loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+                return yaml.load(raw, Loader=loader)
+            else:
+                # orjson is optional; its JSONDecodeError subclasses json's
+                try:
+                    import orjson
+                except ImportError:
+                    return json.loads(raw)
+                return orjson.loads(raw)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in configuration file: {e}")
         except Exception as e:
@@ -144,6 +158,9 @@ class RunCommand(BaseCommand):
         """
         Recursively merge two configuration dictionaries.
 
+        Only the top level of ``base`` is copied; nested dictionaries are
+        merged in place, so callers should pass a freshly built ``base``.
+
         Args:
             base: Base configuration.
             overlay: Configuration to overlay on base.
@@ -152,14 +169,23 @@ class RunCommand(BaseCommand):
             Merged configuration.
         """
         result = base.copy()
+        self._merge_into(result, overlay)
+        return result
 
-        for key, value in overlay.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._merge_configs(result[key], value)
-            else:
-                result[key] = value
+    def _merge_into(self, dest: Dict, src: Dict) -> None:
+        """
+        Merge ``src`` into ``dest`` in place, recursing into nested dicts.
 
-        return result
+        Args:
+            dest: Dictionary to update.
+            src: Dictionary whose values take precedence.
+        """
+        for key, value in src.items():
+            existing = dest.get(key)
+            if type(existing) is dict and type(value) is dict:
+                self._merge_into(existing, value)
+            else:
+                dest[key] = value
 
     def _parse_key_value_pairs(
         self, pairs: List[str], name: str
@@ -234,14 +260,13 @@ class RunCommand(BaseCommand):
         Raises:
             ValueError: If the pair is malformed.
         """
-        if ":" not in pair:
+        match = _PAIR_RE.fullmatch(pair)
+        if match is None:
             raise ValueError(
                 f"Invalid {name} format '{pair}'. Expected 'key:value'."
             )
 
-        parts = pair.split(":", 1)
-        key = parts[0].strip()
-        value = parts[1].strip()
+        key, value = match.groups()
 
         if not key:
             raise ValueError(f"Empty key in {name}: '{pair}'")
@@ -311,9 +336,7 @@ class RunCommand(BaseCommand):
             if pipeline is not None:
                 pipeline.start()
 
-                # Main loop - check for shutdown
-                while not self.shutdown_requested:
-                    time.sleep(0.1)
+                self._wait_for_shutdown()
 
                 pipeline.stop()
             else:
@@ -321,8 +344,7 @@ class RunCommand(BaseCommand):
                 print("[Placeholder] Pipeline components not yet implemented.")
                 print("[Placeholder] Would run with configuration:")
                 print(f"  Source: {config['source']['type']}")
-                while not self.shutdown_requested:
-                    time.sleep(0.1)
+                self._wait_for_shutdown()
 
         except Exception as e:
             self.error(f"Pipeline error: {e}")
@@ -334,6 +356,10 @@ class RunCommand(BaseCommand):
         print("Pipeline stopped.")
         return 0
 
+    def _wait_for_shutdown(self) -> None:
+        """Block until the CLI reports that shutdown was requested."""
+        self.cli.wait_for_shutdown()
+
     def _create_pipeline(self, config: Dict, verbose: bool) -> Optional[object]:
         """
         Create the BCI pipeline from configuration.
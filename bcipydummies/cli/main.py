@@ -5,11 +5,26 @@ Provides the main argument parser and dispatches to command handlers.
 """
 
 import argparse
+import os
 import signal
+import socket
 import sys
 from typing import Optional, List
 
-from .commands import RunCommand, ListWindowsCommand, ListHeadsetsCommand
+from . import commands
+
+# Written with os.write from the signal handler: print() takes the stream's
+# buffer lock and fails with a reentrant-call error if the signal arrives
+# while the main thread is already printing.
+_MSG_GRACEFUL = b"\nShutting down gracefully (press Ctrl+C again to force)...\n"
+_MSG_FORCE = b"\nForce quitting...\n"
+
+# Upper bound on a single shutdown wait. On POSIX a signal interrupts the
+# blocked recv() and the handler's wakeup byte ends it, so no timeout (and
+# no idle wakeups) is needed. On Windows the handler only runs once the main
+# thread is back in Python code, so the timeout bounds how long Ctrl+C takes
+# to be seen.
+_SHUTDOWN_WAIT_TIMEOUT = 0.5 if sys.platform == "win32" else None
 
 
 class CLI:
@@ -17,6 +32,14 @@ class CLI:
 
     def __init__(self):
         self._shutdown_requested = False
+        # Self-pipe created by wait_for_shutdown(). The signal handler only
+        # sets a bool and writes a byte to it, never taking a lock that the
+        # interrupted main thread might already hold. signal.set_wakeup_fd()
+        # is not used: it is process-wide, would replace a wakeup fd already
+        # installed by an embedding event loop (asyncio sets one), and still
+        # needs a socket on Windows.
+        self._wakeup_recv: Optional[socket.socket] = None
+        self._wakeup_send: Optional[socket.socket] = None
         self._setup_signal_handlers()
 
     def _setup_signal_handlers(self) -> None:
@@ -27,18 +50,50 @@ class CLI:
     def _handle_sigint(self, signum: int, frame) -> None:
         """Handle interrupt signal for graceful shutdown."""
         if self._shutdown_requested:
-            # Second interrupt - force exit
-            print("\nForce quitting...", file=sys.stderr)
-            sys.exit(130)
+            # Second interrupt - force exit without waiting on pipeline threads
+            os.write(2, _MSG_FORCE)
+            os._exit(130)
 
         self._shutdown_requested = True
-        print("\nShutting down gracefully (press Ctrl+C again to force)...", file=sys.stderr)
+        wakeup = self._wakeup_send
+        if wakeup is not None:
+            try:
+                wakeup.send(b"\0")
+            except OSError:
+                pass
+        os.write(2, _MSG_GRACEFUL)
 
     @property
     def shutdown_requested(self) -> bool:
         """Check if shutdown was requested."""
         return self._shutdown_requested
 
+    def wait_for_shutdown(self) -> None:
+        """Block until shutdown is requested by SIGINT or SIGTERM."""
+        if self._shutdown_requested:
+            return
+
+        self._wakeup_recv, self._wakeup_send = socket.socketpair()
+        self._wakeup_send.setblocking(False)
+        self._wakeup_recv.settimeout(_SHUTDOWN_WAIT_TIMEOUT)
+
+        try:
+            # A signal landing between the check and recv() has already
+            # queued its wakeup byte, so recv() returns at once rather than
+            # missing it
+            while not self._shutdown_requested:
+                try:
+                    self._wakeup_recv.recv(1)
+                except socket.timeout:
+                    pass
+        finally:
+            # Detach before closing: a handler that already read the send
+            # end gets an OSError from the closed socket, which it ignores
+            wakeup_recv, wakeup_send = self._wakeup_recv, self._wakeup_send
+            self._wakeup_recv = self._wakeup_send = None
+            wakeup_send.close()
+            wakeup_recv.close()
+
     def create_parser(self) -> argparse.ArgumentParser:
         """Create and configure the argument parser."""
         parser = argparse.ArgumentParser(
@@ -115,7 +170,7 @@ class CLI:
             help="Enable debug output",
         )
 
-        run_parser.set_defaults(handler=RunCommand)
+        run_parser.set_defaults(handler="RunCommand")
 
     def _register_list_windows_command(self, subparsers) -> None:
         """Register the 'list-windows' command."""
@@ -131,7 +186,7 @@ class CLI:
             help="Filter windows by name pattern",
         )
 
-        list_windows_parser.set_defaults(handler=ListWindowsCommand)
+        list_windows_parser.set_defaults(handler="ListWindowsCommand")
 
     def _register_list_headsets_command(self, subparsers) -> None:
         """Register the 'list-headsets' command."""
@@ -141,7 +196,7 @@ class CLI:
             description="List all available Emotiv headsets that can be used as data sources.",
         )
 
-        list_headsets_parser.set_defaults(handler=ListHeadsetsCommand)
+        list_headsets_parser.set_defaults(handler="ListHeadsetsCommand")
 
     def run(self, args: Optional[List[str]] = None) -> int:
         """
@@ -160,8 +215,9 @@ class CLI:
             parser.print_help()
             return 0
 
-        # Instantiate and execute the command handler
-        handler_class = parsed_args.handler
+        # Instantiate and execute the command handler. Handlers are stored by
+        # name so only the selected command's module gets imported.
+        handler_class = getattr(commands, parsed_args.handler)
         handler = handler_class(self)
 
         try:
@@ -6,6 +6,7 @@ configuration from YAML files and environment variables.
 
 from __future__ import annotations
 
+import functools
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -13,6 +14,76 @@ from typing import Any, Optional
 
 from .exceptions import ConfigurationError
 
+# Per-command fields of ThresholdConfig and KeyboardConfig
+_COMMAND_FIELDS = (
+    "push",
+    "pull",
+    "lift",
+    "drop",
+    "left",
+    "right",
+    "rotate_left",
+    "rotate_right",
+    "disappear",
+)
+
+# Every ThresholdConfig field, validated in __post_init__
+_THRESHOLD_FIELDS = ("default",) + _COMMAND_FIELDS
+
+# Canonical command names; get_threshold/get_key skip lower() for these
+_CANONICAL_COMMANDS = frozenset(_COMMAND_FIELDS)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_yaml() -> tuple[Any, Any]:
+    """Import PyYAML on first use and pick its fastest safe loader.
+
+    PyYAML stays optional: it is only imported when a YAML file is loaded.
+
+    Returns:
+        Tuple of (yaml module, loader class). The loader is libyaml's
+        CSafeLoader when PyYAML was built with it, else SafeLoader.
+
+    Raises:
+        ConfigurationError: If PyYAML is not installed.
+    """
+    try:
+        import yaml
+    except ImportError as e:
+        raise ConfigurationError(
+            "PyYAML is required for YAML configuration. "
+            "Install it with: pip install pyyaml"
+        ) from e
+    return yaml, getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file, memoized on its path, mtime and size.
+
+    ``mtime_ns`` and ``size`` only take part in the cache key, so an edited
+    file misses the cache and is parsed again. Callers must treat the
+    returned data as read-only since it is shared between calls.
+
+    Args:
+        path: Resolved path of the YAML file.
+        mtime_ns: Modification time of the file, in nanoseconds.
+        size: Size of the file in bytes.
+
+    Returns:
+        The parsed YAML document.
+
+    Raises:
+        ConfigurationError: If PyYAML is missing or the file cannot be parsed.
+    """
+    yaml, loader = _get_yaml()
+    try:
+        # libyaml decodes UTF-8 itself; hand it the raw bytes in one piece
+        with open(path, "rb") as f:
+            return yaml.load(f.read(), Loader=loader)
+    except yaml.YAMLError as e:
+        raise ConfigurationError(f"Failed to parse YAML file: {e}") from e
+
 
 @dataclass(frozen=True)
 class ThresholdConfig:
@@ -47,18 +118,7 @@ class ThresholdConfig:
 
     def __post_init__(self) -> None:
         """Validate all threshold values are within acceptable range."""
-        for attr_name in [
-            "default",
-            "push",
-            "pull",
-            "lift",
-            "drop",
-            "left",
-            "right",
-            "rotate_left",
-            "rotate_right",
-            "disappear",
-        ]:
+        for attr_name in _THRESHOLD_FIELDS:
             value = getattr(self, attr_name)
             if value is not None and not 0.0 <= value <= 1.0:
                 raise ValueError(
@@ -74,7 +134,12 @@ class ThresholdConfig:
         Returns:
             The command-specific threshold if set, otherwise the default.
         """
-        attr_name = command_name.lower()
+        # Callers usually pass canonical lowercase names; only lower() the rest
+        attr_name = (
+            command_name
+            if command_name in _CANONICAL_COMMANDS
+            else command_name.lower()
+        )
         specific_threshold = getattr(self, attr_name, None)
         return specific_threshold if specific_threshold is not None else self.default
 
@@ -116,7 +181,11 @@ class KeyboardConfig:
         Returns:
             The mapped key if configured, otherwise None.
         """
-        attr_name = command_name.lower()
+        attr_name = (
+            command_name
+            if command_name in _CANONICAL_COMMANDS
+            else command_name.lower()
+        )
         return getattr(self, attr_name, None)
 
 
@@ -224,23 +293,14 @@ class Config:
         Raises:
             ConfigurationError: If the file cannot be read or parsed.
         """
-        try:
-            import yaml
-        except ImportError as e:
-            raise ConfigurationError(
-                "PyYAML is required for YAML configuration. "
-                "Install it with: pip install pyyaml"
-            ) from e
+        _get_yaml()
 
         path = Path(path)
         if not path.exists():
             raise ConfigurationError(f"Configuration file not found: {path}")
 
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            raise ConfigurationError(f"Failed to parse YAML file: {e}") from e
+        stat = path.stat()
+        data = _load_yaml_file(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
 
         if data is None:
             raise ConfigurationError("Configuration file is empty")
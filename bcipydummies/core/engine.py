@@ -20,15 +20,14 @@ from __future__ import annotations
 
 import logging
 import threading
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from bcipydummies.core.events import EEGEvent
-from bcipydummies.processors.base import Processor
-from bcipydummies.publishers.base import Publisher
-from bcipydummies.sources.base import EEGSource
 
 if TYPE_CHECKING:
-    pass
+    from bcipydummies.processors.base import Processor
+    from bcipydummies.publishers.base import Publisher
+    from bcipydummies.sources.base import EEGSource
 
 
 logger = logging.getLogger(__name__)
@@ -71,7 +70,8 @@ class BCIPipeline:
 
     Thread Safety:
         All state modifications are protected by a lock. The pipeline
-        is safe to use from multiple threads.
+        is safe to use from multiple threads. The event path and the
+        is_running/statistics reads do not take the lock.
     """
 
     def __init__(
@@ -91,13 +91,20 @@ class BCIPipeline:
                        All ready publishers receive each event (fan-out).
         """
         self._source = source
-        self._processors: List[Processor] = list(processors) if processors else []
-        self._publishers: List[Publisher] = list(publishers) if publishers else []
+        # Copy-on-write tuples: mutators swap in a new tuple under the lock,
+        # so the event path can iterate a snapshot without locking.
+        self._processors: Tuple[Processor, ...] = tuple(processors) if processors else ()
+        self._publishers: Tuple[Publisher, ...] = tuple(publishers) if publishers else ()
 
         # Thread-safe state management
-        self._lock = threading.RLock()
+        # Plain Lock: no locked section calls back into another one, and
+        # component callbacks made under it only reach lock-free reads.
+        self._lock = threading.Lock()
         self._running = False
 
+        # Sampled in start() so the event path can skip building debug args
+        self._log_debug = False
+
         # Statistics for monitoring
         self._events_received = 0
         self._events_processed = 0
@@ -117,8 +124,7 @@ class BCIPipeline:
         Returns:
             True if start() has been called and stop() has not.
         """
-        with self._lock:
-            return self._running
+        return self._running
 
     @property
     def source(self) -> EEGSource:
@@ -132,8 +138,7 @@ class BCIPipeline:
         Returns:
             A copy of the processors list (modifications don't affect pipeline).
         """
-        with self._lock:
-            return list(self._processors)
+        return list(self._processors)
 
     @property
     def publishers(self) -> List[Publisher]:
@@ -142,22 +147,23 @@ class BCIPipeline:
         Returns:
             A copy of the publishers list (modifications don't affect pipeline).
         """
-        with self._lock:
-            return list(self._publishers)
+        return list(self._publishers)
 
     @property
     def statistics(self) -> dict:
         """Pipeline statistics for monitoring.
 
+        The counters are read without locking, so while events are flowing
+        the three values may be from slightly different moments.
+
         Returns:
             Dict with keys: events_received, events_processed, events_dropped
         """
-        with self._lock:
-            return {
-                "events_received": self._events_received,
-                "events_processed": self._events_processed,
-                "events_dropped": self._events_dropped,
-            }
+        return {
+            "events_received": self._events_received,
+            "events_processed": self._events_processed,
+            "events_dropped": self._events_dropped,
+        }
 
     def start(self) -> None:
         """Start all publishers, subscribe to source, and connect source.
@@ -196,6 +202,17 @@ class BCIPipeline:
                         logger.warning("Error stopping publisher during rollback: %s", stop_error)
                 raise
 
+            # Reset statistics
+            self._events_received = 0
+            self._events_processed = 0
+            self._events_dropped = 0
+
+            # Mark running before subscribing: _on_event does not take the
+            # lock, so events the source emits while connecting must not
+            # see a stale _running = False and be dropped
+            self._log_debug = logger.isEnabledFor(logging.DEBUG)
+            self._running = True
+
             # Phase 2: Subscribe to source events
             logger.debug("Subscribing to source events")
             self._source.subscribe(self._on_event)
@@ -207,6 +224,7 @@ class BCIPipeline:
             except Exception as e:
                 # Rollback: unsubscribe and stop publishers
                 logger.error("Failed to connect source: %s", e)
+                self._running = False
                 self._source.unsubscribe(self._on_event)
                 for pub in self._publishers:
                     try:
@@ -215,12 +233,6 @@ class BCIPipeline:
                         logger.warning("Error stopping publisher during rollback: %s", stop_error)
                 raise
 
-            # Reset statistics
-            self._events_received = 0
-            self._events_processed = 0
-            self._events_dropped = 0
-
-            self._running = True
             logger.info("BCI pipeline started successfully")
 
     def stop(self) -> None:
@@ -294,49 +306,53 @@ class BCIPipeline:
 
         Note:
             This method is typically called from a background thread
-            owned by the source. The implementation is thread-safe.
+            owned by the source, and takes no locks. The statistics
+            counters assume a single delivering thread per source.
         """
-        with self._lock:
-            if not self._running:
-                return
+        # Lock-free fast path: _running is a plain bool written under the lock
+        # by start()/stop(), and the counters are only written here, from the
+        # source's delivery thread. Taking the lock here would also stall
+        # stop(), which holds it while the source joins that thread.
+        if not self._running:
+            return
 
-            self._events_received += 1
+        self._events_received += 1
 
         # Process through the processor chain
         current_event: Optional[EEGEvent] = event
 
-        for processor in self._processors:
-            if current_event is None:
-                break
-
-            try:
+        processors = self._processors
+        try:
+            for processor in processors:
                 current_event = processor.process(current_event)
-            except Exception as e:
-                logger.error(
-                    "Processor %s raised exception: %s",
-                    type(processor).__name__,
-                    e,
-                    exc_info=True,
-                )
-                # Drop the event on processor error
-                current_event = None
-                break
+                if current_event is None:
+                    break
+        except Exception as e:
+            logger.error(
+                "Processor %s raised exception: %s",
+                type(processor).__name__,
+                e,
+                exc_info=True,
+            )
+            # Drop the event on processor error
+            current_event = None
 
         # Update statistics
-        with self._lock:
-            if current_event is None:
-                self._events_dropped += 1
-                return
+        if current_event is None:
+            self._events_dropped += 1
+            return
 
-            self._events_processed += 1
+        self._events_processed += 1
 
         # Fan out to all ready publishers
-        for publisher in self._publishers:
+        publishers = self._publishers
+        for publisher in publishers:
             if not publisher.is_ready:
-                logger.debug(
-                    "Skipping publisher %s (not ready)",
-                    type(publisher).__name__,
-                )
+                if self._log_debug:
+                    logger.debug(
+                        "Skipping publisher %s (not ready)",
+                        type(publisher).__name__,
+                    )
                 continue
 
             try:
@@ -360,7 +376,7 @@ class BCIPipeline:
             processor: The processor to add.
         """
         with self._lock:
-            self._processors.append(processor)
+            self._processors = self._processors + (processor,)
             logger.debug("Added processor: %s", type(processor).__name__)
 
     def add_publisher(self, publisher: Publisher) -> None:
@@ -384,7 +400,7 @@ class BCIPipeline:
                     logger.error("Failed to start new publisher: %s", e)
                     raise RuntimeError(f"Failed to start publisher: {e}") from e
 
-            self._publishers.append(publisher)
+            self._publishers = self._publishers + (publisher,)
             logger.debug("Added publisher: %s", type(publisher).__name__)
 
     def remove_processor(self, processor: Processor) -> bool:
@@ -397,12 +413,14 @@ class BCIPipeline:
             True if the processor was found and removed, False otherwise.
         """
         with self._lock:
+            processors = list(self._processors)
             try:
-                self._processors.remove(processor)
-                logger.debug("Removed processor: %s", type(processor).__name__)
-                return True
+                processors.remove(processor)
             except ValueError:
                 return False
+            self._processors = tuple(processors)
+            logger.debug("Removed processor: %s", type(processor).__name__)
+            return True
 
     def remove_publisher(self, publisher: Publisher) -> bool:
         """Remove a publisher from the pipeline.
@@ -416,17 +434,19 @@ class BCIPipeline:
             True if the publisher was found and removed, False otherwise.
         """
         with self._lock:
+            publishers = list(self._publishers)
             try:
-                self._publishers.remove(publisher)
-                if self._running:
-                    try:
-                        publisher.stop()
-                    except Exception as e:
-                        logger.warning("Error stopping removed publisher: %s", e)
-                logger.debug("Removed publisher: %s", type(publisher).__name__)
-                return True
+                publishers.remove(publisher)
             except ValueError:
                 return False
+            self._publishers = tuple(publishers)
+            if self._running:
+                try:
+                    publisher.stop()
+                except Exception as e:
+                    logger.warning("Error stopping removed publisher: %s", e)
+            logger.debug("Removed publisher: %s", type(publisher).__name__)
+            return True
 
     def __enter__(self) -> BCIPipeline:
         """Context manager entry - starts the pipeline."""
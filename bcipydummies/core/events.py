@@ -4,10 +4,15 @@ This module defines the core event types used throughout the BCIpyDummies
 library for representing EEG signals, mental commands, and connection states.
 """
 
+import sys
 from dataclasses import dataclass
 from enum import Enum, auto
 from typing import Optional
 
+# Events are created per sample/command, so give them __slots__ instead of a
+# per-instance __dict__ where dataclasses supports it (Python 3.10+).
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class MentalCommand(Enum):
     """Enumeration of supported mental commands.
@@ -40,18 +45,42 @@ class MentalCommand(Enum):
         Raises:
             ValueError: If the command name is not recognized.
         """
-        normalized = command_name.upper().replace("-", "_").replace(" ", "_")
-        try:
-            return cls[normalized]
-        except KeyError:
-            valid_commands = ", ".join(cmd.name.lower() for cmd in cls)
-            raise ValueError(
-                f"Unknown mental command: '{command_name}'. "
-                f"Valid commands are: {valid_commands}"
-            )
-
-
-@dataclass(frozen=True)
+        command = _COMMAND_LOOKUP.get(command_name)
+        if command is not None:
+            return command
+
+        normalized = command_name.translate(_SEPARATORS_TO_UNDERSCORE).upper()
+        command = _COMMAND_LOOKUP.get(normalized)
+        if command is not None:
+            return command
+
+        raise ValueError(
+            f"Unknown mental command: '{command_name}'. "
+            f"Valid commands are: {_VALID_COMMANDS}"
+        )
+
+
+# Spellings accepted by MentalCommand.from_string without normalizing:
+# canonical names plus their lowercase, dash and space separated forms.
+_COMMAND_LOOKUP = {
+    alias: command
+    for command in MentalCommand
+    for alias in (
+        command.name,
+        command.name.lower(),
+        command.name.lower().replace("_", "-"),
+        command.name.lower().replace("_", " "),
+    )
+}
+
+# Dashes and spaces are accepted in place of underscores
+_SEPARATORS_TO_UNDERSCORE = str.maketrans({"-": "_", " ": "_"})
+
+# Listed in from_string's error message
+_VALID_COMMANDS = ", ".join(command.name.lower() for command in MentalCommand)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class EEGEvent:
     """Base event class for EEG-related data.
 
@@ -64,7 +93,7 @@ class EEGEvent:
     source_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class MentalCommandEvent(EEGEvent):
     """Event representing a detected mental command.
 
@@ -89,8 +118,41 @@ class MentalCommandEvent(EEGEvent):
         if not 0.0 <= self.power <= 1.0:
             raise ValueError(f"Power must be between 0.0 and 1.0, got {self.power}")
 
+    @classmethod
+    def from_trusted(
+        cls,
+        timestamp: float,
+        source_id: str,
+        command: MentalCommand,
+        power: float,
+        action: Optional[str] = None,
+    ) -> "MentalCommandEvent":
+        """Create an event without running validation.
+
+        For sources that already guarantee ``power`` is within [0.0, 1.0],
+        such as after clamping. Other callers should use the constructor.
+
+        Args:
+            timestamp: Unix timestamp in seconds when the event occurred.
+            source_id: Identifier of the source that generated this event.
+            command: The mental command that was detected.
+            power: Power level, already within [0.0, 1.0].
+            action: Optional mapped action string.
+
+        Returns:
+            The new MentalCommandEvent.
+        """
+        event = object.__new__(cls)
+        # Frozen dataclass: assign fields the same way the generated __init__ does
+        object.__setattr__(event, "timestamp", timestamp)
+        object.__setattr__(event, "source_id", source_id)
+        object.__setattr__(event, "command", command)
+        object.__setattr__(event, "power", power)
+        object.__setattr__(event, "action", action)
+        return event
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class ConnectionEvent:
     """Event representing a connection state change.
 
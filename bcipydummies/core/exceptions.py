@@ -15,6 +15,14 @@ class BCIError(Exception):
     All exceptions in the bcipydummies library inherit from this class,
     making it easy to catch any BCI-related error with a single handler.
 
+    The full message (with source and subclass context) is only built
+    when the exception is converted to a string, so exceptions that are
+    raised and caught without being logged stay cheap to construct. It is
+    rebuilt on every str(), so later changes to attributes such as
+    ``source_id`` or ``cause`` are reflected. ``args`` (and therefore
+    ``repr()``) holds only the raw ``message``; use ``str()`` for the
+    formatted text.
+
     Attributes:
         message: Human-readable error description.
         source_id: Optional identifier of the source that raised the error.
@@ -27,7 +35,10 @@ class BCIError(Exception):
     ) -> None:
         self.message = message
         self.source_id = source_id
-        super().__init__(self._format_message())
+        super().__init__(message)
+
+    def __str__(self) -> str:
+        return self._format_message()
 
     def _format_message(self) -> str:
         """Format the error message with optional source context."""
@@ -20,18 +20,19 @@ Usage:
 
 from __future__ import annotations
 
+import importlib
 import logging
-from typing import TYPE_CHECKING, Dict, List, Optional, Type
+import sys
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
 
-from bcipydummies.core.config import Config
+from bcipydummies.core.config import _COMMAND_FIELDS, Config
 from bcipydummies.core.engine import BCIPipeline
 from bcipydummies.core.exceptions import ConfigurationError
-from bcipydummies.processors.base import Processor
-from bcipydummies.publishers.base import Publisher
-from bcipydummies.sources.base import EEGSource
 
 if TYPE_CHECKING:
-    pass
+    from bcipydummies.processors.base import Processor
+    from bcipydummies.publishers.base import Publisher
+    from bcipydummies.sources.base import EEGSource
 
 
 logger = logging.getLogger(__name__)
@@ -52,6 +53,75 @@ _PROCESSOR_REGISTRY: Dict[str, Type[Processor]] = {}
 _PUBLISHER_REGISTRY: Dict[str, Type[Publisher]] = {}
 
 
+# Sorted names returned by the get_available_* functions, keyed by registry
+# kind ("sources", "processors", "publishers"). register_* drops the entry.
+_AVAILABLE_CACHE: Dict[str, Tuple[str, ...]] = {}
+
+
+# Result of each optional import keyed by (module, attribute). Failed imports
+# are cached as their ImportError so a missing extra is not searched for on
+# sys.path again on every factory call.
+_IMPORT_CACHE: Dict[Tuple[str, str], Any] = {}
+
+
+def _import_optional(module_name: str, attr_name: str) -> Any:
+    """Import an attribute from a module that may not be available.
+
+    Args:
+        module_name: Absolute name of the module to import.
+        attr_name: Name of the attribute to fetch from the module.
+
+    Returns:
+        The requested attribute.
+
+    Raises:
+        ImportError: If the module cannot be imported or lacks the
+            attribute, now or on an earlier call.
+    """
+    key = (module_name, attr_name)
+    try:
+        result = _IMPORT_CACHE[key]
+    except KeyError:
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError as e:
+            result = e
+        else:
+            try:
+                result = getattr(module, attr_name)
+            except AttributeError:
+                # Match "from module import name" for a missing attribute
+                result = ImportError(
+                    f"cannot import name {attr_name!r} from {module_name!r}",
+                    name=module_name,
+                    path=getattr(module, "__file__", None),
+                )
+        _IMPORT_CACHE[key] = result
+
+    if isinstance(result, ImportError):
+        # Raise a fresh error so repeated failures don't pile onto the
+        # cached exception's traceback
+        raise type(result)(
+            str(result), name=result.name, path=result.path
+        ) from result
+    return result
+
+
+def _registry_key(name: str) -> str:
+    """Normalize a registered name to its lowercase, interned form.
+
+    Interning lets lookups with literal names (which CPython interns) match
+    registry keys by identity instead of comparing characters.
+
+    Args:
+        name: Name as passed to one of the register_* functions.
+
+    Returns:
+        The lowercase, interned name.
+    """
+    return sys.intern(name.lower())
+
+
 def register_source(name: str, source_class: Type[EEGSource]) -> None:
     """Register a source implementation for factory use.
 
@@ -59,7 +129,8 @@ def register_source(name: str, source_class: Type[EEGSource]) -> None:
         name: Name to register the source under (e.g., "emotiv", "simulated").
         source_class: The source class to register.
     """
-    _SOURCE_REGISTRY[name.lower()] = source_class
+    _SOURCE_REGISTRY[_registry_key(name)] = source_class
+    _AVAILABLE_CACHE.pop("sources", None)
     logger.debug("Registered source: %s -> %s", name, source_class.__name__)
 
 
@@ -70,7 +141,8 @@ def register_processor(name: str, processor_class: Type[Processor]) -> None:
         name: Name to register the processor under (e.g., "threshold", "debounce").
         processor_class: The processor class to register.
     """
-    _PROCESSOR_REGISTRY[name.lower()] = processor_class
+    _PROCESSOR_REGISTRY[_registry_key(name)] = processor_class
+    _AVAILABLE_CACHE.pop("processors", None)
     logger.debug("Registered processor: %s -> %s", name, processor_class.__name__)
 
 
@@ -81,7 +153,8 @@ def register_publisher(name: str, publisher_class: Type[Publisher]) -> None:
         name: Name to register the publisher under (e.g., "console", "keyboard").
         publisher_class: The publisher class to register.
     """
-    _PUBLISHER_REGISTRY[name.lower()] = publisher_class
+    _PUBLISHER_REGISTRY[_registry_key(name)] = publisher_class
+    _AVAILABLE_CACHE.pop("publishers", None)
     logger.debug("Registered publisher: %s -> %s", name, publisher_class.__name__)
 
 
@@ -91,34 +164,20 @@ def _register_defaults() -> None:
     This function is called automatically on first use of factory functions.
     It populates the registries with built-in implementations.
     """
-    # Register processors
-    try:
-        from bcipydummies.processors import (
-            ThresholdProcessor,
-            DebounceProcessor,
-            CommandMapper,
-        )
-        register_processor("threshold", ThresholdProcessor)
-        register_processor("debounce", DebounceProcessor)
-        register_processor("mapper", CommandMapper)
-        register_processor("command_mapper", CommandMapper)
-    except ImportError as e:
-        logger.debug("Could not import processors: %s", e)
-
-    # Register publishers
-    try:
-        from bcipydummies.publishers import ConsolePublisher
-        register_publisher("console", ConsolePublisher)
-    except ImportError as e:
-        logger.debug("Could not import ConsolePublisher: %s", e)
+    # Keyboard publishers are not registered: they need a target window and
+    # are built through create_keyboard_publisher only when one is configured.
+    from bcipydummies.processors import (
+        ThresholdProcessor,
+        DebounceProcessor,
+        CommandMapper,
+    )
+    from bcipydummies.publishers import ConsolePublisher
 
-    try:
-        from bcipydummies.publishers.keyboard import create_keyboard_publisher
-        # Note: keyboard publisher requires special handling
-        # Register a placeholder - actual creation uses create_keyboard_publisher
-        pass
-    except ImportError as e:
-        logger.debug("Could not import keyboard publisher: %s", e)
+    register_processor("threshold", ThresholdProcessor)
+    register_processor("debounce", DebounceProcessor)
+    register_processor("mapper", CommandMapper)
+    register_processor("command_mapper", CommandMapper)
+    register_publisher("console", ConsolePublisher)
 
 
 # Track whether defaults have been registered
@@ -156,25 +215,26 @@ def create_source(source_type: str, config: Config) -> EEGSource:
         >>> config = Config.from_env()
         >>> source = create_source("emotiv", config)
     """
-    _ensure_defaults_registered()
-
-    source_type = source_type.lower()
+    # No sources are registered by default, so skip _ensure_defaults_registered
+    # and avoid importing processors and publishers just to build a source.
+    # Names are stored lowercase; only lower() the caller's spelling on a miss
+    builder = _BUILTIN_SOURCES.get(source_type)
+    if builder is None and source_type not in _SOURCE_REGISTRY:
+        source_type = source_type.lower()
+        builder = _BUILTIN_SOURCES.get(source_type)
     logger.debug("Creating source of type: %s", source_type)
 
-    if source_type == "emotiv":
-        return _create_emotiv_source(config)
-    elif source_type == "simulated":
-        return _create_simulated_source(config)
-    elif source_type in _SOURCE_REGISTRY:
+    if builder is not None:
+        return builder(config)
+    if source_type in _SOURCE_REGISTRY:
         source_class = _SOURCE_REGISTRY[source_type]
         # Generic instantiation - may need config adaptation
         return source_class(source_id=f"{source_type}-source")
-    else:
-        available = list(_SOURCE_REGISTRY.keys()) + ["emotiv", "simulated"]
-        raise ConfigurationError(
-            f"Unknown source type: '{source_type}'. "
-            f"Available types: {', '.join(sorted(set(available)))}"
-        )
+
+    raise ConfigurationError(
+        f"Unknown source type: '{source_type}'. "
+        f"Available types: {', '.join(get_available_sources())}"
+    )
 
 
 def _create_emotiv_source(config: Config) -> EEGSource:
@@ -190,7 +250,7 @@ def _create_emotiv_source(config: Config) -> EEGSource:
         ConfigurationError: If Emotiv source cannot be created.
     """
     try:
-        from bcipydummies.sources.emotiv import EmotivSource
+        EmotivSource = _import_optional("bcipydummies.sources.emotiv", "EmotivSource")
     except ImportError as e:
         raise ConfigurationError(
             "Emotiv source requires additional dependencies. "
@@ -218,7 +278,9 @@ def _create_simulated_source(config: Config) -> EEGSource:
         ConfigurationError: If simulated source cannot be created.
     """
     try:
-        from bcipydummies.sources.simulated import SimulatedSource
+        SimulatedSource = _import_optional(
+            "bcipydummies.sources.simulated", "SimulatedSource"
+        )
     except ImportError:
         # Provide a basic simulated source inline
         return _create_basic_simulated_source()
@@ -263,20 +325,30 @@ def _create_basic_simulated_source() -> EEGSource:
             self._connected = False
 
         def _emit_loop(self) -> None:
-            commands = list(MentalCommand)
+            commands = tuple(MentalCommand)
+            source_id = self._source_id
+            choice = random.choice
+            uniform = random.uniform
             while not self._stop_event.wait(timeout=0.5):
-                command = random.choice(commands)
-                power = random.uniform(0.3, 1.0)
-                event = MentalCommandEvent(
-                    source_id=self._source_id,
-                    command=command,
-                    power=power,
+                # uniform(0.3, 1.0) is always a valid power, skip validation
+                event = MentalCommandEvent.from_trusted(
+                    timestamp=time.time(),
+                    source_id=source_id,
+                    command=choice(commands),
+                    power=uniform(0.3, 1.0),
                 )
                 self._emit(event)
 
     return BasicSimulatedSource()
 
 
+# Built-in source types handled by create_source, checked before the registry
+_BUILTIN_SOURCES = {
+    "emotiv": _create_emotiv_source,
+    "simulated": _create_simulated_source,
+}
+
+
 def create_processors(config: Config) -> List[Processor]:
     """Create the standard processor chain from configuration.
 
@@ -311,10 +383,7 @@ def create_processors(config: Config) -> List[Processor]:
 
         # Build thresholds dict from config
         thresholds = {}
-        for command_name in [
-            "push", "pull", "lift", "drop", "left", "right",
-            "rotate_left", "rotate_right", "disappear"
-        ]:
+        for command_name in _COMMAND_FIELDS:
             threshold = getattr(config.thresholds, command_name, None)
             if threshold is not None:
                 thresholds[command_name] = threshold
@@ -377,7 +446,9 @@ def create_publishers(config: Config) -> List[Publisher]:
     # Create keyboard publisher if target window is configured
     if config.target_window:
         try:
-            from bcipydummies.publishers.keyboard import create_keyboard_publisher
+            create_keyboard_publisher = _import_optional(
+                "bcipydummies.publishers.keyboard", "create_keyboard_publisher"
+            )
 
             keyboard_pub = create_keyboard_publisher(
                 window_name=config.target_window,
@@ -406,10 +477,7 @@ def _build_key_mapping(config: Config) -> Dict[str, str]:
         Dict mapping command names to key names.
     """
     mapping = {}
-    for command_name in [
-        "push", "pull", "lift", "drop", "left", "right",
-        "rotate_left", "rotate_right", "disappear"
-    ]:
+    for command_name in _COMMAND_FIELDS:
         key = getattr(config.keyboard, command_name, None)
         if key:
             mapping[command_name] = key
@@ -521,8 +589,11 @@ def get_available_sources() -> List[str]:
     Returns:
         List of registered source type names.
     """
-    _ensure_defaults_registered()
-    return sorted(set(list(_SOURCE_REGISTRY.keys()) + ["emotiv", "simulated"]))
+    names = _AVAILABLE_CACHE.get("sources")
+    if names is None:
+        names = tuple(sorted({*_SOURCE_REGISTRY, "emotiv", "simulated"}))
+        _AVAILABLE_CACHE["sources"] = names
+    return list(names)
 
 
 def get_available_processors() -> List[str]:
@@ -532,7 +603,11 @@ def get_available_processors() -> List[str]:
         List of registered processor type names.
     """
     _ensure_defaults_registered()
-    return sorted(_PROCESSOR_REGISTRY.keys())
+    names = _AVAILABLE_CACHE.get("processors")
+    if names is None:
+        names = tuple(sorted(_PROCESSOR_REGISTRY))
+        _AVAILABLE_CACHE["processors"] = names
+    return list(names)
 
 
 def get_available_publishers() -> List[str]:
@@ -542,4 +617,8 @@ def get_available_publishers() -> List[str]:
         List of registered publisher type names.
     """
     _ensure_defaults_registered()
-    return sorted(set(list(_PUBLISHER_REGISTRY.keys()) + ["console", "keyboard"]))
+    names = _AVAILABLE_CACHE.get("publishers")
+    if names is None:
+        names = tuple(sorted({*_PUBLISHER_REGISTRY, "console", "keyboard"}))
+        _AVAILABLE_CACHE["publishers"] = names
+    return list(names)
@@ -1,14 +1,26 @@
 import websocket
 import json
+import logging
 import threading
 import time
-import win32gui
-import win32con
+
+try:
+    import win32gui
+    import win32con
+except ImportError:
+    # Fuera de Windows (o sin pywin32) el módulo se puede importar igual;
+    # el error se da al crear el controlador o al listar ventanas
+    win32gui = None
+    win32con = None
 
 # ============================================
 #  🧱 CÓDIGO BASE - EMOTIV EEG CONTROL MODULE
 # ============================================
 
+# Los mensajes por cada comando mental van al logger (nivel DEBUG) en lugar de
+# print, para no escribir en stdout con cada muestra recibida
+logger = logging.getLogger(__name__)
+
 VK_CODES = {
     'A': 0x41,
     'S': 0x53,
@@ -17,6 +29,29 @@ VK_CODES = {
     'SPACE': 0x20
 }
 
+# Codificador JSON compacto para las peticiones (sin espacios tras "," y ":")
+_encode = json.JSONEncoder(separators=(",", ":")).encode
+
+# queryHeadsets no lleva parámetros variables: se codifica una sola vez
+_QUERY_HEADSETS_REQUEST = _encode({
+    "jsonrpc": "2.0",
+    "method": "queryHeadsets",
+    "params": {},
+    "id": 2
+})
+
+# Acción mental -> (potencia mínima, indicador, tecla, duración de la pulsación)
+COMMAND_ACTIONS = {
+    'left': (0.80, '<--', 'A', 0.05),
+    'right': (0.00, '-->', 'D', 0.2),
+    'lift': (0.00, '^', 'SPACE', 0.45),
+}
+
+def _require_win32():
+    """Comprueba que pywin32 está disponible."""
+    if win32gui is None:
+        raise RuntimeError("❌ EmotivController requiere Windows con pywin32 instalado.")
+
 class EmotivController:
     """
     Controlador principal que conecta con el Emotiv Cortex API
@@ -24,6 +59,7 @@ class EmotivController:
     """
 
     def __init__(self, window_name: str):
+        _require_win32()
         self.window_name = window_name
         self.hwnd = self._find_window(window_name)
         self.ws_app = None
@@ -31,6 +67,13 @@ class EmotivController:
         self.cortex_token = None
         self.session_id = None
         self.headset_id = None
+        # id de la petición -> método que procesa su respuesta
+        self._handlers = {
+            1: self._on_authorized,
+            2: self._on_headsets,
+            3: self._on_session_created,
+            4: self._on_subscribed,
+        }
 
         if not self.hwnd:
             raise RuntimeError(f"❌ No se encontró la ventana: '{window_name}'")
@@ -46,12 +89,17 @@ class EmotivController:
     @staticmethod
     def list_windows():
         """Devuelve una lista con los títulos de todas las ventanas visibles."""
+        _require_win32()
         ventanas = []
+        # Referencias locales: el callback se ejecuta una vez por ventana
+        agregar = ventanas.append
+        es_visible = win32gui.IsWindowVisible
+        obtener_titulo = win32gui.GetWindowText
         def callback(hwnd, _):
-            if win32gui.IsWindowVisible(hwnd):
-                titulo = win32gui.GetWindowText(hwnd)
+            if es_visible(hwnd):
+                titulo = obtener_titulo(hwnd)
                 if titulo:
-                    ventanas.append(titulo)
+                    agregar(titulo)
         win32gui.EnumWindows(callback, None)
         return ventanas
 
@@ -61,10 +109,10 @@ class EmotivController:
 
     def _press_key(self, key: str, hold=0.05):
         """Presiona y suelta una tecla."""
-        if key not in VK_CODES:
+        keycode = VK_CODES.get(key)
+        if keycode is None:
             print(f"⚠️ Tecla {key} no reconocida.")
             return
-        keycode = VK_CODES[key]
         win32gui.PostMessage(self.hwnd, win32con.WM_KEYDOWN, keycode, 0)
         time.sleep(hold)
         win32gui.PostMessage(self.hwnd, win32con.WM_KEYUP, keycode, 0)
@@ -75,23 +123,22 @@ class EmotivController:
 
     def _control(self, key, hold=0.05):
         """Ejecuta la acción asociada a una tecla."""
-        print(f"🎯 Ejecutando control: {key}")
+        logger.debug("🎯 Ejecutando control: %s", key)
         self._press_key(key, hold)
 
     def _process_command(self, action, power):
         """Procesa los comandos mentales recibidos del Emotiv."""
-        if action == "left" and power >= 0.80:
-            print(f"<-- Potencia: {power * 100:.1f}%")
-            self._control('A')
-            self.lastMove = 'A'
-        elif action == "right" and power >= 0.00:
-            print(f"--> Potencia: {power * 100:.1f}%")
-            self._control('D', 0.2)
-            self.lastMove = 'D'
-        elif action == "lift" and power >= 0.00:
-            print(f"^ Potencia: {power * 100:.1f}%")
-            self._control('SPACE', 0.45)
+        entry = COMMAND_ACTIONS.get(action)
+        if entry is None or power < entry[0]:
+            return
+        _, indicator, key, hold = entry
+        logger.debug("%s Potencia: %.1f%%", indicator, power * 100)
+        self._control(key, hold)
+        if action == "lift":
+            # Después del salto se repite el último movimiento lateral
             self._control(self.lastMove, 0.02)
+        else:
+            self.lastMove = key
 
     # -----------------------------
     # 🔌 WebSocket con Emotiv Cortex
@@ -99,49 +146,56 @@ class EmotivController:
 
     def _on_message(self, ws, message):
         data = json.loads(message)
-        if data.get("id") == 1 and "result" in data:
-            self.cortex_token = data["result"]["cortexToken"]
-            print("🔑 Token obtenido:", self.cortex_token)
-            ws.send(json.dumps({
-                "jsonrpc": "2.0",
-                "method": "queryHeadsets",
-                "params": {},
-                "id": 2
-            }))
-        elif data.get("id") == 2 and "result" in data:
-            if data["result"]:
-                self.headset_id = data["result"][0]["id"]
-                print("🎧 Headset:", self.headset_id)
-                ws.send(json.dumps({
-                    "jsonrpc": "2.0",
-                    "method": "createSession",
-                    "params": {
-                        "cortexToken": self.cortex_token,
-                        "headset": self.headset_id,
-                        "status": "active"
-                    },
-                    "id": 3
-                }))
-            else:
-                print("⚠️ No se encontró ningún headset.")
-        elif data.get("id") == 3 and "result" in data:
-            self.session_id = data["result"]["id"]
-            print("🆔 Sesión creada:", self.session_id)
-            ws.send(json.dumps({
+        # Los mensajes del stream "com" son los más frecuentes: se atienden primero
+        com = data.get("com")
+        if com is not None:
+            action, power = com
+            self._process_command(action, power)
+            return
+
+        # Respuestas del handshake: se despachan según el id de la petición
+        handler = self._handlers.get(data.get("id"))
+        if handler is not None and "result" in data:
+            handler(ws, data["result"])
+
+    def _on_authorized(self, ws, result):
+        self.cortex_token = result["cortexToken"]
+        print("🔑 Token obtenido:", self.cortex_token)
+        ws.send(_QUERY_HEADSETS_REQUEST)
+
+    def _on_headsets(self, ws, result):
+        if result:
+            self.headset_id = result[0]["id"]
+            print("🎧 Headset:", self.headset_id)
+            ws.send(_encode({
                 "jsonrpc": "2.0",
-                "method": "subscribe",
+                "method": "createSession",
                 "params": {
                     "cortexToken": self.cortex_token,
-                    "session": self.session_id,
-                    "streams": ["com"]
+                    "headset": self.headset_id,
+                    "status": "active"
                 },
-                "id": 4
+                "id": 3
             }))
-        elif data.get("id") == 4 and "result" in data:
-            print("✅ Suscripción completada.")
-        if "com" in data:
-            action, power = data["com"]
-            self._process_command(action, power)
+        else:
+            print("⚠️ No se encontró ningún headset.")
+
+    def _on_session_created(self, ws, result):
+        self.session_id = result["id"]
+        print("🆔 Sesión creada:", self.session_id)
+        ws.send(_encode({
+            "jsonrpc": "2.0",
+            "method": "subscribe",
+            "params": {
+                "cortexToken": self.cortex_token,
+                "session": self.session_id,
+                "streams": ["com"]
+            },
+            "id": 4
+        }))
+
+    def _on_subscribed(self, ws, result):
+        print("✅ Suscripción completada.")
 
     def _on_error(self, ws, error):
         print("❌ Error:", error)
@@ -151,7 +205,7 @@ class EmotivController:
 
     def _on_open(self, ws):
         print("🔐 Autenticando con Emotiv Cortex...")
-        ws.send(json.dumps({
+        ws.send(_encode({
             "jsonrpc": "2.0",
             "method": "authorize",
             "params": {
@@ -176,7 +230,17 @@ class EmotivController:
             on_error=self._on_error,
             on_close=self._on_close
         )
-        thread = threading.Thread(target=self.ws_app.run_forever)
+        # Pings de keepalive para detectar conexiones caídas; Cortex solo envía
+        # JSON, así que se omite la validación UTF-8 de cada trama. El hilo no
+        # es daemon: mantiene vivo el script tras connect() (ver README)
+        thread = threading.Thread(
+            target=self.ws_app.run_forever,
+            kwargs={
+                "ping_interval": 20,
+                "ping_timeout": 10,
+                "skip_utf8_validation": True,
+            },
+        )
         thread.start()
         print("🧠 Conectando a Emotiv Cortex...")
         return thread
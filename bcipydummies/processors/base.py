@@ -8,12 +8,16 @@ for modular composition of filtering, transformation, and mapping operations.
 from abc import ABC, abstractmethod
 from typing import Optional, TypeVar
 
-from bcipydummies.core.events import EEGEvent
+from bcipydummies.core.events import EEGEvent, MentalCommand
 
 
 # Type variable for more specific event types in subclasses
 E = TypeVar("E", bound=EEGEvent)
 
+# Lowercase config key of each command, so processors reading their
+# per-command settings don't call command.name.lower() on every event
+_COMMAND_KEYS = {command: command.name.lower() for command in MentalCommand}
+
 
 class Processor(ABC):
     """Abstract base class defining the processor interface.
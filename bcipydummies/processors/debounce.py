@@ -9,7 +9,7 @@ from dataclasses import dataclass, field
 from typing import Dict, Optional
 
 from bcipydummies.core.events import EEGEvent, MentalCommand, MentalCommandEvent
-from bcipydummies.processors.base import Processor
+from bcipydummies.processors.base import _COMMAND_KEYS, Processor
 
 
 @dataclass
@@ -110,9 +110,8 @@ class DebounceProcessor(Processor):
         Returns:
             The configured cooldown, or default if not configured.
         """
-        command_name = command.name.lower()
         return self.config.per_command_cooldown.get(
-            command_name,
+            _COMMAND_KEYS[command],
             self.config.cooldown
         )
 
@@ -132,13 +131,13 @@ class DebounceProcessor(Processor):
 
         current_time = self._time_source()
         command = event.command
-        cooldown = self._get_cooldown(command)
 
         last_time = self._last_command_times.get(command)
 
+        # Only look up the cooldown when there is a previous occurrence
         if last_time is not None:
             elapsed = current_time - last_time
-            if elapsed < cooldown:
+            if elapsed < self._get_cooldown(command):
                 return None
 
         # Update the last command time and pass through
@@ -9,7 +9,7 @@ from dataclasses import dataclass, field, replace
 from typing import Dict, Optional
 
 from bcipydummies.core.events import EEGEvent, MentalCommand, MentalCommandEvent
-from bcipydummies.processors.base import Processor
+from bcipydummies.processors.base import _COMMAND_KEYS, Processor
 
 
 @dataclass
@@ -94,8 +94,7 @@ class CommandMapper(Processor):
         Returns:
             The mapped action string, or None if not mapped.
         """
-        command_name = command.name.lower()
-        return self.config.mapping.get(command_name)
+        return self.config.mapping.get(_COMMAND_KEYS[command])
 
     def process(self, event: EEGEvent) -> Optional[EEGEvent]:
         """Map command to action and create a new event with the action set.
@@ -9,7 +9,7 @@ from dataclasses import dataclass, field
 from typing import Dict, Optional
 
 from bcipydummies.core.events import EEGEvent, MentalCommand, MentalCommandEvent
-from bcipydummies.processors.base import Processor
+from bcipydummies.processors.base import _COMMAND_KEYS, Processor
 
 
 @dataclass
@@ -104,9 +104,8 @@ class ThresholdProcessor(Processor):
         Returns:
             The configured threshold, or default if not configured.
         """
-        command_name = command.name.lower()
         return self.config.thresholds.get(
-            command_name,
+            _COMMAND_KEYS[command],
             self.config.default_threshold
         )
 
@@ -24,19 +24,34 @@ Example:
         publisher.press_key("SPACE")
 """
 
+import importlib
+
 from bcipydummies.publishers.base import Publisher
 from bcipydummies.publishers.console import ConsolePublisher
-from bcipydummies.publishers.keyboard import (
-    KeyboardPublisher,
-    create_keyboard_publisher,
-    get_keyboard_publisher_class,
-)
-
-# Platform-specific imports with graceful fallback
-try:
-    from bcipydummies.publishers.keyboard import WindowsKeyboardPublisher
-except ImportError:
-    WindowsKeyboardPublisher = None  # type: ignore
+
+# Keyboard publishers resolved on first access (PEP 562), so console-only
+# users never import the keyboard package or its platform dependencies.
+_LAZY_IMPORTS = {
+    "KeyboardPublisher": "bcipydummies.publishers.keyboard",
+    "WindowsKeyboardPublisher": "bcipydummies.publishers.keyboard",
+    "create_keyboard_publisher": "bcipydummies.publishers.keyboard",
+    "get_keyboard_publisher_class": "bcipydummies.publishers.keyboard",
+}
+
+
+def __getattr__(name: str):
+    """Lazy loading for the keyboard publishers."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     # Base classes
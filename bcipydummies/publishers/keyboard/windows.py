@@ -5,14 +5,16 @@ win32gui and win32con to simulate keyboard input to a target window.
 """
 
 import time
-from typing import TYPE_CHECKING
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Mapping
 
 if TYPE_CHECKING:
     from bcipydummies.core.events import EEGEvent
 
-# Virtual key codes for Windows
+# Virtual key codes for Windows, exposed read-only so every publisher
+# shares one table.
 # Reference: https://docs.microsoft.com/en-us/windows/win32/inputdev/virtual-key-codes
-VK_CODES: dict[str, int] = {
+VK_CODES: Mapping[str, int] = MappingProxyType({
     # Letters (A-Z)
     "A": 0x41, "B": 0x42, "C": 0x43, "D": 0x44, "E": 0x45,
     "F": 0x46, "G": 0x47, "H": 0x48, "I": 0x49, "J": 0x4A,
@@ -50,7 +52,7 @@ VK_CODES: dict[str, int] = {
     # Additional keys
     "CAPSLOCK": 0x14, "NUMLOCK": 0x90, "SCROLLLOCK": 0x91,
     "PRINTSCREEN": 0x2C, "PAUSE": 0x13,
-}
+})
 
 
 class WindowsKeyboardPublisher:
@@ -179,12 +181,15 @@ class WindowsKeyboardPublisher:
         import win32gui
 
         windows: list[str] = []
+        append = windows.append
+        is_visible = win32gui.IsWindowVisible
+        get_text = win32gui.GetWindowText
 
         def callback(hwnd: int, _) -> bool:
-            if win32gui.IsWindowVisible(hwnd):
-                title = win32gui.GetWindowText(hwnd)
+            if is_visible(hwnd):
+                title = get_text(hwnd)
                 if title:
-                    windows.append(title)
+                    append(title)
             return True
 
         win32gui.EnumWindows(callback, None)
@@ -203,13 +208,16 @@ class WindowsKeyboardPublisher:
         import win32gui
 
         matches: list[tuple[int, str]] = []
+        append = matches.append
+        is_visible = win32gui.IsWindowVisible
+        get_text = win32gui.GetWindowText
         pattern_lower = pattern.lower()
 
         def callback(hwnd: int, _) -> bool:
-            if win32gui.IsWindowVisible(hwnd):
-                title = win32gui.GetWindowText(hwnd)
+            if is_visible(hwnd):
+                title = get_text(hwnd)
                 if title and pattern_lower in title.lower():
-                    matches.append((hwnd, title))
+                    append((hwnd, title))
             return True
 
         win32gui.EnumWindows(callback, None)
@@ -301,34 +309,84 @@ class WindowsKeyboardPublisher:
                 # Window may have been closed or cannot be focused
                 pass
 
-    def press_key(self, key: str, hold: float | None = None) -> None:
+    def press_key(self, key: str | int, hold: float | None = None) -> None:
         """Simulate a key press and release.
 
         Args:
             key: The key to press (e.g., "A", "SPACE", "ENTER").
-                 Case-insensitive.
+                 Case-insensitive. A virtual key code from VK_CODES is
+                 also accepted and sent as-is.
             hold: Duration to hold the key in seconds. Uses default_hold_time if None.
 
         Raises:
             ValueError: If the key is not recognized.
             RuntimeError: If the publisher is not ready or no window is targeted.
         """
+        self._check_target()
+        vk_code = self._resolve_vk_code(key)
+        hold_time = hold if hold is not None else self._default_hold_time
+        self._send_key(vk_code, hold_time)
+
+    def press_keys(self, keys: list[str | int], hold: float | None = None) -> None:
+        """Press multiple keys in sequence.
+
+        All keys are resolved before any is sent, so an unrecognized key
+        raises without pressing the keys before it.
+
+        Args:
+            keys: List of keys to press in order.
+            hold: Hold time for each key. Uses default_hold_time if None.
+
+        Raises:
+            ValueError: If any key is not recognized.
+            RuntimeError: If the publisher is not ready or no window is targeted.
+        """
+        self._check_target()
+        vk_codes = [self._resolve_vk_code(key) for key in keys]
+        hold_time = hold if hold is not None else self._default_hold_time
+        for vk_code in vk_codes:
+            self._send_key(vk_code, hold_time)
+
+    def _check_target(self) -> None:
+        """Ensure the publisher is started and has a target window.
+
+        Raises:
+            RuntimeError: If the publisher is not ready or no window is targeted.
+        """
         if not self._is_ready:
             raise RuntimeError("Publisher not started. Call start() first.")
 
         if self._hwnd is None:
             raise RuntimeError("No target window. Set window_name or call find_window().")
 
-        key_upper = key.upper()
-        if key_upper not in VK_CODES:
+    @staticmethod
+    def _resolve_vk_code(key: str | int) -> int:
+        """Resolve a key name or virtual key code to a virtual key code.
+
+        Args:
+            key: Case-insensitive key name, or a virtual key code.
+
+        Returns:
+            The virtual key code.
+
+        Raises:
+            ValueError: If the key is not recognized.
+        """
+        vk_code = key if type(key) is int else VK_CODES.get(key.upper())
+        if vk_code is None:
             raise ValueError(
                 f"Unrecognized key: '{key}'. "
                 f"Valid keys: {', '.join(sorted(VK_CODES.keys()))}"
             )
+        return vk_code
 
-        hold_time = hold if hold is not None else self._default_hold_time
-        vk_code = VK_CODES[key_upper]
+    def _send_key(self, vk_code: int, hold_time: float) -> None:
+        """Post key down and key up messages to the target window.
 
+        Args:
+            vk_code: Virtual key code to send.
+            hold_time: Seconds to wait between key down and key up.
+        """
         # Send key down
         self._win32gui.PostMessage(
             self._hwnd,
@@ -349,16 +407,6 @@ class WindowsKeyboardPublisher:
             0
         )
 
-    def press_keys(self, keys: list[str], hold: float | None = None) -> None:
-        """Press multiple keys in sequence.
-
-        Args:
-            keys: List of keys to press in order.
-            hold: Hold time for each key. Uses default_hold_time if None.
-        """
-        for key in keys:
-            self.press_key(key, hold)
-
     def publish(self, event: "EEGEvent") -> None:
         """Publish an EEG event as keyboard input.
 
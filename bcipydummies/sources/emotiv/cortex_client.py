@@ -31,6 +31,9 @@ from bcipydummies.core.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# JSON-RPC requests go over the wire without the default ", " / ": " padding
+_encode_request = json.JSONEncoder(separators=(",", ":")).encode
+
 
 class CortexState(Enum):
     """States for the Cortex API connection flow."""
@@ -231,7 +234,14 @@ class CortexClient:
         ssl_context.check_hostname = False
         ssl_context.verify_mode = ssl.CERT_NONE
 
-        self._ws.run_forever(sslopt={"context": ssl_context})
+        # Keepalive pings detect a dead Cortex service on idle connections;
+        # Cortex only sends JSON text, so per-frame UTF-8 checks are skipped
+        self._ws.run_forever(
+            sslopt={"context": ssl_context},
+            ping_interval=20,
+            ping_timeout=10,
+            skip_utf8_validation=True,
+        )
 
     def disconnect(self) -> None:
         """Disconnect from the Cortex API.
@@ -282,7 +292,7 @@ class CortexClient:
         }
 
         logger.debug(f"Sending request: {method}")
-        self._ws.send(json.dumps(request))
+        self._ws.send(_encode_request(request))
 
     # -------------------------------------------------------------------------
     # WebSocket Event Handlers
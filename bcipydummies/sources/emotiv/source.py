@@ -189,8 +189,8 @@ class EmotivSource(BaseEEGSource):
         # Clamp power to valid range
         power = max(0.0, min(1.0, power))
 
-        # Create and emit the event
-        event = MentalCommandEvent(
+        # Create and emit the event; power was clamped above
+        event = MentalCommandEvent.from_trusted(
             timestamp=time.time(),
             source_id=self.source_id,
             command=command,
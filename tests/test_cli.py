@@ -0,0 +1,605 @@
+"""Tests for BCIpyDummies CLI commands.
+
+This module contains tests for:
+- ListWindowsCommand: Window enumeration backends and filtering
+- CLI: Signal handling and shutdown wait
+- RunCommand: Config file loading and key:value parsing
+"""
+
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import types
+import pytest
+from unittest.mock import MagicMock, patch
+
+from bcipydummies.cli.commands import list_windows
+from bcipydummies.cli.main import CLI
+from bcipydummies.cli.commands.list_windows import ListWindowsCommand
+from bcipydummies.cli.commands.run import RunCommand
+
+
+# ===========================================================================
+# Fixtures and helpers
+# ===========================================================================
+
+
+@pytest.fixture
+def command():
+    """ListWindowsCommand bound to a mock CLI."""
+    return ListWindowsCommand(MagicMock())
+
+
+def completed(stdout: bytes = b"", returncode: int = 0):
+    """Build a finished subprocess result with the given output."""
+    return subprocess.CompletedProcess(
+        args=[], returncode=returncode, stdout=stdout, stderr=b""
+    )
+
+
+def fake_xlib(client_ids, names):
+    """Build a stand-in for the python-xlib package.
+
+    Args:
+        client_ids: Window ids published in _NET_CLIENT_LIST, or None if the
+                    window manager does not publish the property.
+        names: Mapping of window id to its _NET_WM_NAME value (bytes), or
+               None to fall back to WM_NAME.
+    """
+    def make_window(wid):
+        window = MagicMock()
+        name = names.get(wid)
+        window.get_full_property.return_value = (
+            types.SimpleNamespace(value=name) if name is not None else None
+        )
+        window.get_wm_name.return_value = "legacy name"
+        return window
+
+    x_display = MagicMock()
+    x_display.screen.return_value.root.get_full_property.return_value = (
+        types.SimpleNamespace(value=client_ids) if client_ids is not None else None
+    )
+    x_display.create_resource_object.side_effect = lambda _, wid: make_window(wid)
+
+    xlib = types.ModuleType("Xlib")
+    xlib.Xatom = types.SimpleNamespace(WINDOW=33)
+    xlib.display = types.SimpleNamespace(Display=MagicMock(return_value=x_display))
+    return xlib, x_display
+
+
+def fake_user32(windows):
+    """Build a stand-in for ctypes.WinDLL("user32").
+
+    Args:
+        windows: List of (hwnd, visible, class_name, title) tuples.
+    """
+    by_hwnd = {hwnd: (visible, cls, title) for hwnd, visible, cls, title in windows}
+
+    def get_class_name(hwnd, buffer, size):
+        buffer.value = by_hwnd[hwnd][1]
+        return len(buffer.value)
+
+    def get_window_text(hwnd, buffer, size):
+        buffer.value = by_hwnd[hwnd][2]
+        return len(buffer.value)
+
+    def enum_windows(callback, lparam):
+        for hwnd, *_ in windows:
+            if not callback(hwnd, lparam):
+                break
+        return True
+
+    user32 = MagicMock()
+    user32.IsWindowVisible.side_effect = lambda hwnd: by_hwnd[hwnd][0]
+    user32.GetClassNameW.side_effect = get_class_name
+    user32.GetWindowTextW.side_effect = get_window_text
+    user32.EnumWindows.side_effect = enum_windows
+    return user32
+
+
+# ===========================================================================
+# Linux Backend Tests
+# ===========================================================================
+
+
+class TestListWindowsXlib:
+    """Tests for the python-xlib backend."""
+
+    def test_reads_client_list(self, command):
+        """Should list every client window with its EWMH name."""
+        xlib, x_display = fake_xlib(
+            client_ids=[0x1200003, 0x1400007],
+            names={0x1200003: "Terminal".encode(), 0x1400007: "Café".encode()},
+        )
+
+        with patch.dict(sys.modules, {"Xlib": xlib}):
+            windows = command._get_windows_xlib()
+
+        assert windows == [("0x01200003", "Terminal"), ("0x01400007", "Café")]
+        x_display.close.assert_called_once()
+
+    def test_falls_back_to_wm_name(self, command):
+        """Windows without _NET_WM_NAME should use WM_NAME."""
+        xlib, _ = fake_xlib(client_ids=[0x10], names={})
+
+        with patch.dict(sys.modules, {"Xlib": xlib}):
+            windows = command._get_windows_xlib()
+
+        assert windows == [("0x00000010", "legacy name")]
+
+    def test_returns_none_without_client_list(self, command):
+        """A window manager without _NET_CLIENT_LIST should defer to wmctrl."""
+        xlib, x_display = fake_xlib(client_ids=None, names={})
+
+        with patch.dict(sys.modules, {"Xlib": xlib}):
+            assert command._get_windows_xlib() is None
+        x_display.close.assert_called_once()
+
+    def test_returns_none_without_display(self, command):
+        """No reachable X display should defer to the subprocess backends."""
+        xlib, _ = fake_xlib(client_ids=[], names={})
+        xlib.display.Display.side_effect = RuntimeError("no display")
+
+        with patch.dict(sys.modules, {"Xlib": xlib}):
+            assert command._get_windows_xlib() is None
+
+    def test_returns_none_when_not_installed(self, command):
+        """Missing python-xlib should defer to the subprocess backends."""
+        with patch.dict(sys.modules, {"Xlib": None}):
+            assert command._get_windows_xlib() is None
+
+
+class TestListWindowsLinuxSubprocess:
+    """Tests for the wmctrl and xdotool backends."""
+
+    @pytest.fixture(autouse=True)
+    def no_xlib(self):
+        """Force the subprocess backends by hiding python-xlib."""
+        with patch.dict(sys.modules, {"Xlib": None}):
+            yield
+
+    def test_parses_wmctrl_output(self, command):
+        """wmctrl lines should split into id and title, skipping bad lines."""
+        output = (
+            b"0x01e00003  0 host Terminal\n"
+            b"0x02400007 -1 host   Two  spaces  kept\n"
+            b"garbage\n"
+            b"0x02600001  0 host Caf\xc3\xa9\n"
+        )
+
+        with patch("subprocess.run", return_value=completed(output)) as run:
+            windows = command._get_windows_linux()
+
+        assert windows == [
+            ("0x01e00003", "Terminal"),
+            ("0x02400007", "Two  spaces  kept"),
+            ("0x02600001", "Café"),
+        ]
+        run.assert_called_once()
+        assert run.call_args.kwargs["timeout"] == 10
+
+    def test_wmctrl_timeout_falls_back_to_xdotool(self, command):
+        """A hung wmctrl should time out and fall through to xdotool."""
+        results = iter([
+            subprocess.TimeoutExpired(cmd="wmctrl", timeout=10),
+            completed(b"101\n102\n"),
+            completed(b"Editor\nBrowser\n"),
+        ])
+
+        def run(*args, **kwargs):
+            result = next(results)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        with patch("subprocess.run", side_effect=run):
+            windows = command._get_windows_linux()
+
+        assert windows == [("101", "Editor"), ("102", "Browser")]
+
+    def test_xdotool_names_stay_aligned(self, command):
+        """Empty names should map to 'Unknown' without shifting later ids."""
+        with patch(
+            "subprocess.run", return_value=completed(b"first\n\nthird\n")
+        ) as run:
+            titles = command._get_window_names_xdotool(["1", "2", "3"])
+
+        assert titles == ["first", "Unknown", "third"]
+        assert run.call_args.args[0][-3:] == ["1", "2", "3"]
+
+    def test_xdotool_short_output_is_padded(self, command):
+        """Missing trailing lines should be reported as 'Unknown'."""
+        with patch("subprocess.run", return_value=completed(b"only\n")):
+            titles = command._get_window_names_xdotool(["1", "2", "3"])
+
+        assert titles == ["only", "Unknown", "Unknown"]
+
+    def test_xdotool_names_skip_subprocess_without_ids(self, command):
+        """No window ids should not spawn a shell."""
+        with patch("subprocess.run") as run:
+            assert command._get_window_names_xdotool([]) == []
+        run.assert_not_called()
+
+    def test_xdotool_batch_timeout_falls_back_per_window(self, command):
+        """A batch timeout should keep printed names and look up the rest singly."""
+        timeout = subprocess.TimeoutExpired(cmd="sh", timeout=10, output=b"first\nsec")
+        results = iter([
+            timeout,
+            subprocess.TimeoutExpired(cmd="xdotool", timeout=2),
+            completed(b"third\n"),
+        ])
+
+        def run(*args, **kwargs):
+            result = next(results)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        with patch("subprocess.run", side_effect=run) as mock_run:
+            titles = command._get_window_names_xdotool(["1", "2", "3"])
+
+        assert titles == ["first", "Unknown", "third"]
+        assert mock_run.call_args_list[1].args[0] == ["xdotool", "getwindowname", "2"]
+        assert mock_run.call_args_list[2].args[0] == ["xdotool", "getwindowname", "3"]
+
+    def test_raises_when_no_tool_installed(self, command):
+        """Missing wmctrl and xdotool should raise NotImplementedError."""
+        with patch("subprocess.run", side_effect=FileNotFoundError):
+            with pytest.raises(NotImplementedError, match="wmctrl"):
+                command._get_windows_linux()
+
+
+# ===========================================================================
+# Windows Backend Tests
+# ===========================================================================
+
+
+class TestListWindowsWin32:
+    """Tests for the ctypes user32 backend."""
+
+    def enumerate(self, command, windows):
+        user32 = fake_user32(windows)
+        with patch("ctypes.WinDLL", return_value=user32, create=True), \
+                patch("ctypes.WINFUNCTYPE", return_value=lambda fn: fn, create=True):
+            return command._get_windows_win32(), user32
+
+    def test_lists_visible_titled_windows(self, command):
+        """Only visible windows with a title should be listed."""
+        windows, _ = self.enumerate(command, [
+            (100, True, "Notepad", "notes.txt - Notepad"),
+            (200, False, "Chrome_WidgetWin_1", "Hidden"),
+            (300, True, "Chrome_WidgetWin_1", ""),
+        ])
+
+        assert windows == [("100", "notes.txt - Notepad")]
+
+    def test_skips_desktop_shell_windows(self, command):
+        """Progman and WorkerW windows should be skipped before reading titles."""
+        windows, user32 = self.enumerate(command, [
+            (1, True, "Progman", "Program Manager"),
+            (2, True, "WorkerW", "Desktop"),
+            (3, True, "Notepad", "Untitled - Notepad"),
+        ])
+
+        assert windows == [("3", "Untitled - Notepad")]
+        read = [c.args[0] for c in user32.GetWindowTextW.call_args_list]
+        assert read == [3]
+
+    def test_declares_hwnd_prototypes(self, command):
+        """HWND arguments should be declared so 64-bit handles aren't truncated."""
+        from ctypes import wintypes
+
+        _, user32 = self.enumerate(command, [])
+
+        assert user32.IsWindowVisible.argtypes == [wintypes.HWND]
+        assert user32.GetClassNameW.argtypes[0] is wintypes.HWND
+        assert user32.GetWindowTextW.argtypes[0] is wintypes.HWND
+        assert user32.EnumWindows.argtypes[1] is wintypes.LPARAM
+
+
+# ===========================================================================
+# macOS Backend Tests
+# ===========================================================================
+
+
+class TestListWindowsMacOS:
+    """Tests for the Quartz and AppleScript backends."""
+
+    def quartz(self, infos):
+        module = types.ModuleType("Quartz")
+        module.CGWindowListCopyWindowInfo = MagicMock(return_value=infos)
+        module.kCGNullWindowID = 0
+        module.kCGWindowListOptionOnScreenOnly = 1
+        return module
+
+    def test_quartz_lists_titled_windows(self, command):
+        """Quartz entries with a title should be listed as 'owner: title'."""
+        quartz = self.quartz([
+            {"kCGWindowNumber": 41, "kCGWindowOwnerName": "Safari",
+             "kCGWindowName": "Apple"},
+            {"kCGWindowNumber": 42, "kCGWindowOwnerName": "Dock",
+             "kCGWindowName": ""},
+            {"kCGWindowNumber": 43, "kCGWindowOwnerName": "Menubar"},
+        ])
+
+        with patch.dict(sys.modules, {"Quartz": quartz}):
+            windows = command._get_windows_quartz()
+
+        assert windows == [("41", "Safari: Apple")]
+
+    def test_quartz_without_titles_returns_none(self, command):
+        """Without Screen Recording permission no entry has a title."""
+        quartz = self.quartz([
+            {"kCGWindowNumber": 41, "kCGWindowOwnerName": "Safari"},
+        ])
+
+        with patch.dict(sys.modules, {"Quartz": quartz}):
+            assert command._get_windows_quartz() is None
+
+    def test_untitled_quartz_falls_back_to_applescript(self, command):
+        """The AppleScript query should run when Quartz has no titles."""
+        quartz = self.quartz([{"kCGWindowNumber": 41, "kCGWindowOwnerName": "Safari"}])
+        output = "Safari: Apple, Inc.\nTerminal: bash\n".encode()
+
+        with patch.dict(sys.modules, {"Quartz": quartz}), \
+                patch("subprocess.run", return_value=completed(output)) as run:
+            windows = command._get_windows_macos()
+
+        assert windows == [("0", "Safari: Apple, Inc."), ("1", "Terminal: bash")]
+        assert run.call_args.args[0][0] == "osascript"
+
+    def test_applescript_pairs_names_in_one_process_loop(self, command):
+        """Process and window names should come from the same loop and be joined once."""
+        script = list_windows._APPLESCRIPT_WINDOWS
+
+        assert script.count("every process") == 1
+        assert "set end of entries" in script
+        assert "text item delimiters to linefeed" in script
+
+    def test_applescript_output_is_one_entry_per_line(self, command):
+        """The joined AppleScript output should parse without a trailing newline."""
+        output = "Safari: Apple, Inc.\nTerminal: bash".encode()
+
+        with patch.dict(sys.modules, {"Quartz": None}), \
+                patch("subprocess.run", return_value=completed(output)) as run:
+            windows = command._get_windows_macos()
+
+        assert windows == [("0", "Safari: Apple, Inc."), ("1", "Terminal: bash")]
+        assert run.call_args.args[0] == ["osascript", "-e", list_windows._APPLESCRIPT_WINDOWS]
+
+    def test_quartz_not_installed_returns_none(self, command):
+        """Missing pyobjc should defer to AppleScript."""
+        with patch.dict(sys.modules, {"Quartz": None}):
+            assert command._get_windows_quartz() is None
+
+
+# ===========================================================================
+# Filtering and Output Tests
+# ===========================================================================
+
+
+class TestListWindowsFilter:
+    """Tests for --filter matching and command output."""
+
+    WINDOWS = [
+        ("1", "Mozilla Firefox"),
+        ("2", "Terminal - bash"),
+        ("3", "firefox [private]"),
+    ]
+
+    def test_plain_text_is_case_insensitive_substring(self, command):
+        """Patterns without glob characters should match as substrings."""
+        result = list(command._filter_windows(self.WINDOWS, "FIREFOX"))
+
+        assert result == [("1", "Mozilla Firefox"), ("3", "firefox [private]")]
+
+    def test_glob_pattern(self, command):
+        """Patterns with glob characters should use fnmatch semantics."""
+        result = list(command._filter_windows(self.WINDOWS, "term*bash"))
+
+        assert result == [("2", "Terminal - bash")]
+
+    def test_filter_streams_lazily(self, command):
+        """Filtering should not consume the input before iteration."""
+        consumed = []
+
+        def windows():
+            for window in self.WINDOWS:
+                consumed.append(window)
+                yield window
+
+        result = command._filter_windows(windows(), "bash")
+
+        assert consumed == []
+        assert next(result) == ("2", "Terminal - bash")
+
+    def test_execute_reports_no_matches(self, command, capsys):
+        """A filter matching nothing should print a message and succeed."""
+        args = types.SimpleNamespace(filter="nothing-matches")
+
+        with patch.object(ListWindowsCommand, "_get_windows", return_value=self.WINDOWS):
+            exit_code = command.execute(args)
+
+        assert exit_code == 0
+        assert "No windows matching 'nothing-matches' found." in capsys.readouterr().out
+
+    def test_execute_prints_table(self, command, capsys):
+        """Matching windows should be printed with their ids."""
+        args = types.SimpleNamespace(filter="bash")
+
+        with patch.object(ListWindowsCommand, "_get_windows", return_value=self.WINDOWS):
+            exit_code = command.execute(args)
+
+        out = capsys.readouterr().out
+        assert exit_code == 0
+        assert "Found 1 window(s):" in out
+        assert "2   Terminal - bash" in out
+
+
+# ===========================================================================
+# Shutdown Handling Tests
+# ===========================================================================
+
+
+class TestCLIShutdown:
+    """Tests for the SIGINT/SIGTERM handler and wait_for_shutdown()."""
+
+    @pytest.fixture
+    def cli(self, monkeypatch):
+        """CLI with signal installation and stderr writes stubbed out."""
+        writes = []
+        monkeypatch.setattr(signal, "signal", MagicMock())
+        monkeypatch.setattr(os, "write", lambda fd, data: writes.append((fd, data)))
+        cli = CLI()
+        cli.writes = writes
+        return cli
+
+    def wait_in_thread(self, cli):
+        waiter = threading.Thread(target=cli.wait_for_shutdown, daemon=True)
+        waiter.start()
+        return waiter
+
+    def test_handler_from_another_thread_ends_wait(self, cli):
+        """A handler call while wait_for_shutdown() blocks should make it return."""
+        timer = threading.Timer(0.1, cli._handle_sigint, (signal.SIGINT, None))
+
+        waiter = self.wait_in_thread(cli)
+        timer.start()
+        waiter.join(timeout=5)
+        timer.cancel()
+
+        assert not waiter.is_alive()
+        assert cli.shutdown_requested
+        assert cli.writes == [(2, b"\nShutting down gracefully (press Ctrl+C again to force)...\n")]
+
+    def test_handler_before_wait_returns_immediately(self, cli):
+        """A shutdown requested before waiting should not block."""
+        cli._handle_sigint(signal.SIGTERM, None)
+
+        waiter = self.wait_in_thread(cli)
+        waiter.join(timeout=5)
+
+        assert not waiter.is_alive()
+
+    def test_wait_closes_wakeup_sockets(self, cli):
+        """Both ends of the wakeup socketpair should be closed after the wait."""
+        opened = []
+        real_socketpair = socket.socketpair
+
+        def socketpair():
+            pair = real_socketpair()
+            opened.extend(pair)
+            return pair
+
+        timer = threading.Timer(0.1, cli._handle_sigint, (signal.SIGINT, None))
+        with patch("socket.socketpair", side_effect=socketpair):
+            waiter = self.wait_in_thread(cli)
+            timer.start()
+            waiter.join(timeout=5)
+        timer.cancel()
+
+        assert not waiter.is_alive()
+        assert len(opened) == 2
+        assert all(sock.fileno() == -1 for sock in opened)
+        assert cli._wakeup_recv is None and cli._wakeup_send is None
+
+    def test_second_signal_forces_exit(self, cli, monkeypatch):
+        """A second interrupt should exit at once with status 130."""
+        exit_codes = []
+
+        def fake_exit(code):
+            exit_codes.append(code)
+            raise SystemExit(code)
+
+        monkeypatch.setattr(os, "_exit", fake_exit)
+
+        cli._handle_sigint(signal.SIGINT, None)
+        assert exit_codes == []
+
+        with pytest.raises(SystemExit):
+            cli._handle_sigint(signal.SIGINT, None)
+
+        assert exit_codes == [130]
+        assert cli.writes[-1] == (2, b"\nForce quitting...\n")
+
+
+# ===========================================================================
+# Run Command Tests
+# ===========================================================================
+
+
+@pytest.fixture
+def run_command():
+    """RunCommand bound to a mock CLI."""
+    return RunCommand(MagicMock())
+
+
+class TestRunConfigFile:
+    """Tests for loading --config files."""
+
+    def test_loads_json(self, run_command, tmp_path):
+        """JSON files should be parsed into a dictionary."""
+        path = tmp_path / "config.json"
+        path.write_text('{"thresholds": {"default": 0.7}}')
+
+        assert run_command._load_config_file(str(path)) == {"thresholds": {"default": 0.7}}
+
+    def test_loads_yaml(self, run_command, tmp_path):
+        """YAML files should be parsed with the safe loader."""
+        pytest.importorskip("yaml")
+        path = tmp_path / "config.yaml"
+        path.write_text("keyboard:\n  lift: space\n")
+
+        assert run_command._load_config_file(str(path)) == {"keyboard": {"lift": "space"}}
+
+    def test_each_load_returns_a_fresh_dict(self, run_command, tmp_path):
+        """Mutating one loaded config should not affect the next load."""
+        path = tmp_path / "config.json"
+        path.write_text('{"thresholds": {"default": 0.7}}')
+
+        first = run_command._load_config_file(str(path))
+        first["thresholds"]["default"] = 0.1
+
+        assert run_command._load_config_file(str(path))["thresholds"]["default"] == 0.7
+
+    def test_invalid_json_raises_value_error(self, run_command, tmp_path):
+        """Malformed JSON should be reported as ValueError."""
+        path = tmp_path / "config.json"
+        path.write_text("{not json")
+
+        with pytest.raises(ValueError, match="Invalid JSON"):
+            run_command._load_config_file(str(path))
+
+    def test_missing_file_raises_value_error(self, run_command, tmp_path):
+        """A missing file should be reported as ValueError."""
+        with pytest.raises(ValueError, match="not found"):
+            run_command._load_config_file(str(tmp_path / "missing.json"))
+
+
+class TestRunSplitPair:
+    """Tests for splitting --map/--threshold key:value pairs."""
+
+    @pytest.mark.parametrize("pair, expected", [
+        ("lift:space", ("lift", "space")),
+        ("  lift : space ", ("lift", "space")),
+        ("url:http://host:80", ("url", "http://host:80")),
+        ("multi\nline:value\nmore", ("multi\nline", "value\nmore")),
+    ])
+    def test_valid_pairs(self, run_command, pair, expected):
+        """Pairs split on the first colon with surrounding whitespace trimmed."""
+        assert run_command._split_pair(pair, "map") == expected
+
+    @pytest.mark.parametrize("pair, message", [
+        (":space", "Empty key"),
+        ("  : space", "Empty key"),
+        ("lift:", "Empty value"),
+        ("lift:   ", "Empty value"),
+        ("lift", "Expected 'key:value'"),
+    ])
+    def test_invalid_pairs(self, run_command, pair, message):
+        """Empty keys or values and missing colons should raise ValueError."""
+        with pytest.raises(ValueError, match=message):
+            run_command._split_pair(pair, "map")
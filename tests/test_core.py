@@ -5,9 +5,11 @@ This module tests:
 - Exceptions (exceptions.py): All exception types and inheritance hierarchy
 - Config (config.py): ThresholdConfig, KeyboardConfig, EmotivConfig, Config
 - Engine (engine.py): BCIPipeline lifecycle and event processing
+- Factory (factory.py): Optional imports, registries and source dispatch
 """
 
 import os
+import sys
 import tempfile
 from dataclasses import FrozenInstanceError
 from typing import Optional
@@ -38,6 +40,7 @@ from bcipydummies.core.config import (
     Config,
 )
 from bcipydummies.core.engine import BCIPipeline
+from bcipydummies.core import factory
 from bcipydummies.processors.base import Processor
 from bcipydummies.publishers.base import Publisher
 from bcipydummies.sources.base import BaseEEGSource
@@ -143,6 +146,25 @@ class TestMentalCommand:
         assert "Unknown mental command" in str(exc_info.value)
         assert "invalid_command" in str(exc_info.value)
 
+    @pytest.mark.parametrize("name", [
+        "rotate_left",
+        "ROTATE_LEFT",
+        "Rotate_Left",
+        "rotate-left",
+        "ROTATE-LEFT",
+        "rotate left",
+        "Rotate Left",
+        "rotate-Left",
+    ])
+    def test_mental_command_from_string_accepted_spellings(self, name):
+        """Case, hyphen, space and underscore spellings should all resolve."""
+        assert MentalCommand.from_string(name) == MentalCommand.ROTATE_LEFT
+
+    def test_mental_command_from_string_rejects_missing_separator(self):
+        """Names without a separator between words should be rejected."""
+        with pytest.raises(ValueError, match="Unknown mental command"):
+            MentalCommand.from_string("rotateleft")
+
 
 class TestEEGEvent:
     """Tests for EEGEvent dataclass."""
@@ -250,6 +272,24 @@ class TestMentalCommandEvent:
         with pytest.raises(FrozenInstanceError):
             event.power = 0.9
 
+    def test_mental_command_event_from_trusted(self):
+        """from_trusted should build an event equal to the constructor's."""
+        event = MentalCommandEvent.from_trusted(
+            timestamp=1000.0,
+            source_id="test",
+            command=MentalCommand.PUSH,
+            power=0.5,
+        )
+        assert event == MentalCommandEvent(
+            timestamp=1000.0,
+            source_id="test",
+            command=MentalCommand.PUSH,
+            power=0.5,
+        )
+        assert event.action is None
+        with pytest.raises(FrozenInstanceError):
+            event.power = 0.9
+
 
 class TestConnectionEvent:
     """Tests for ConnectionEvent dataclass."""
@@ -302,6 +342,20 @@ class TestBCIError:
         error = BCIError("test")
         assert isinstance(error, Exception)
 
+    def test_bci_error_str_and_args(self):
+        """str() should be formatted while args keeps the raw message."""
+        error = BCIError("Test error", source_id="device-001")
+        assert str(error) == "[device-001] Test error"
+        assert error.args == ("Test error",)
+
+    def test_bci_error_str_reflects_later_changes(self):
+        """str() should not go stale when source_id changes after a call."""
+        error = BCIError("Test error")
+        assert str(error) == "Test error"
+
+        error.source_id = "device-002"
+        assert str(error) == "[device-002] Test error"
+
 
 class TestConnectionError:
     """Tests for ConnectionError exception."""
@@ -319,6 +373,22 @@ class TestConnectionError:
         assert "OSError" in str(error)
         assert "Network unreachable" in str(error)
 
+    def test_connection_error_str_and_args(self):
+        """str() should include source and cause while args keeps the raw message."""
+        error = ConnectionError(
+            "Failed to connect", source_id="emotiv", cause=OSError("refused")
+        )
+        assert str(error) == "[emotiv] Failed to connect (caused by: OSError: refused)"
+        assert error.args == ("Failed to connect",)
+
+    def test_connection_error_str_reflects_later_cause(self):
+        """A cause attached after the first str() should appear in later ones."""
+        error = ConnectionError("Failed to connect", source_id="emotiv")
+        assert str(error) == "[emotiv] Failed to connect"
+
+        error.cause = TimeoutError("timed out")
+        assert str(error) == "[emotiv] Failed to connect (caused by: TimeoutError: timed out)"
+
     def test_connection_error_can_be_caught_as_bci_error(self):
         """ConnectionError should be catchable as BCIError."""
         with pytest.raises(BCIError):
@@ -450,6 +520,16 @@ class TestExceptionHierarchy:
 # ===========================================================================
 
 
+class _CountingName(str):
+    """String that records calls to lower(), for lookup fast-path tests."""
+
+    lower_calls = 0
+
+    def lower(self) -> str:
+        type(self).lower_calls += 1
+        return super().lower()
+
+
 class TestThresholdConfig:
     """Tests for ThresholdConfig dataclass."""
 
@@ -491,6 +571,17 @@ class TestThresholdConfig:
         assert config.get_threshold("push") == 0.6
         assert config.get_threshold("unknown") == 0.6
 
+    def test_get_threshold_skips_lower_for_canonical_names(self):
+        """Canonical lowercase names should be looked up without lower()."""
+        config = ThresholdConfig(default=0.5, rotate_left=0.9)
+        _CountingName.lower_calls = 0
+
+        assert config.get_threshold(_CountingName("rotate_left")) == 0.9
+        assert _CountingName.lower_calls == 0
+
+        assert config.get_threshold(_CountingName("ROTATE_LEFT")) == 0.9
+        assert _CountingName.lower_calls == 1
+
     def test_threshold_config_immutability(self):
         """ThresholdConfig should be frozen."""
         config = ThresholdConfig()
@@ -526,6 +617,17 @@ class TestKeyboardConfig:
         assert config.get_key("push") is None
         assert config.get_key("unknown") is None
 
+    def test_get_key_skips_lower_for_canonical_names(self):
+        """Canonical lowercase names should be looked up without lower()."""
+        config = KeyboardConfig(lift="space")
+        _CountingName.lower_calls = 0
+
+        assert config.get_key(_CountingName("lift")) == "space"
+        assert _CountingName.lower_calls == 0
+
+        assert config.get_key(_CountingName("Lift")) == "space"
+        assert _CountingName.lower_calls == 1
+
     def test_keyboard_config_immutability(self):
         """KeyboardConfig should be frozen."""
         config = KeyboardConfig()
@@ -706,6 +808,29 @@ thresholds:
         finally:
             os.unlink(temp_path)
 
+    def test_config_from_yaml_reloads_modified_file(self):
+        """Config.from_yaml should pick up changes to a previously loaded file."""
+        yaml_content = """
+emotiv:
+  client_id: first-id
+  client_secret: secret
+"""
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".yaml", delete=False
+        ) as f:
+            f.write(yaml_content)
+            temp_path = f.name
+
+        try:
+            assert Config.from_yaml(temp_path).emotiv.client_id == "first-id"
+
+            with open(temp_path, "w") as f:
+                f.write(yaml_content.replace("first-id", "second-id"))
+
+            assert Config.from_yaml(temp_path).emotiv.client_id == "second-id"
+        finally:
+            os.unlink(temp_path)
+
     def test_config_from_env(self):
         """Config.from_env should create config from environment."""
         with patch.dict(os.environ, {
@@ -881,6 +1006,28 @@ class TestBCIPipelineEventFlow:
         assert processor1.events_received[0] is event
         pipeline.stop()
 
+    def test_events_emitted_during_connect_are_processed(self):
+        """Events the source emits while connecting should not be dropped."""
+        event = MentalCommandEvent(
+            timestamp=100.0,
+            source_id="test",
+            command=MentalCommand.LEFT,
+            power=0.8
+        )
+
+        class EagerSource(MockSource):
+            def connect(self) -> None:
+                super().connect()
+                self.emit_event(event)
+
+        publisher = MockPublisher()
+        pipeline = BCIPipeline(source=EagerSource(), publishers=[publisher])
+        pipeline.start()
+
+        assert publisher.events_published == [event]
+        assert pipeline.statistics["events_received"] == 1
+        pipeline.stop()
+
     def test_event_reaches_publishers(self):
         """Processed events should reach all publishers."""
         source = MockSource()
@@ -1225,3 +1372,152 @@ class TestBCIPipelineRepr:
         assert "processors=1" in repr_str
         assert "publishers=1" in repr_str
         assert "running=False" in repr_str
+
+
+# ===========================================================================
+# FACTORY TESTS (core/factory.py)
+# ===========================================================================
+
+
+@pytest.fixture
+def factory_state(monkeypatch):
+    """Give each test empty factory caches and copies of the registries."""
+    monkeypatch.setattr(factory, "_IMPORT_CACHE", {})
+    monkeypatch.setattr(factory, "_AVAILABLE_CACHE", {})
+    monkeypatch.setattr(factory, "_SOURCE_REGISTRY", dict(factory._SOURCE_REGISTRY))
+    monkeypatch.setattr(factory, "_PROCESSOR_REGISTRY", dict(factory._PROCESSOR_REGISTRY))
+    monkeypatch.setattr(factory, "_PUBLISHER_REGISTRY", dict(factory._PUBLISHER_REGISTRY))
+    return factory
+
+
+class TestFactoryImportOptional:
+    """Tests for the cached optional imports used by the factories."""
+
+    def test_missing_module_is_only_imported_once(self, factory_state):
+        """A failed import should be cached and re-raised without retrying."""
+        with patch(
+            "importlib.import_module",
+            side_effect=ModuleNotFoundError("No module named 'extra'", name="extra"),
+        ) as import_module:
+            for _ in range(3):
+                with pytest.raises(ImportError, match="extra"):
+                    factory_state._import_optional("extra", "Thing")
+
+        import_module.assert_called_once_with("extra")
+
+    def test_missing_attribute_raises_import_error(self, factory_state):
+        """A module without the attribute should fail like 'from m import name'."""
+        with pytest.raises(ImportError, match="cannot import name 'Missing'") as exc_info:
+            factory_state._import_optional("json", "Missing")
+
+        assert exc_info.value.name == "json"
+        assert not isinstance(exc_info.value, AttributeError)
+
+    def test_repeated_failure_raises_fresh_error(self, factory_state):
+        """Each call should raise a new exception chained to the cached one."""
+        errors = []
+        for _ in range(2):
+            with pytest.raises(ImportError) as exc_info:
+                factory_state._import_optional("json", "Missing")
+            errors.append(exc_info.value)
+
+        assert errors[0] is not errors[1]
+        assert errors[0].__cause__ is errors[1].__cause__
+
+    def test_successful_import_is_cached(self, factory_state):
+        """A found attribute should be returned from the cache afterwards."""
+        import json
+
+        assert factory_state._import_optional("json", "dumps") is json.dumps
+        with patch("importlib.import_module") as import_module:
+            assert factory_state._import_optional("json", "dumps") is json.dumps
+        import_module.assert_not_called()
+
+
+class TestFactoryRegistries:
+    """Tests for register_* and the cached get_available_* lists."""
+
+    def test_register_source_refreshes_available_sources(self, factory_state):
+        """A newly registered source should appear in the cached list."""
+        before = factory_state.get_available_sources()
+        assert "custom" not in before
+
+        factory_state.register_source("custom", MockSource)
+
+        assert "custom" in factory_state.get_available_sources()
+
+    def test_register_processor_refreshes_available_processors(self, factory_state):
+        """A newly registered processor should appear in the cached list."""
+        assert "custom" not in factory_state.get_available_processors()
+
+        factory_state.register_processor("custom", MockProcessor)
+
+        assert "custom" in factory_state.get_available_processors()
+
+    def test_register_publisher_refreshes_available_publishers(self, factory_state):
+        """A newly registered publisher should appear in the cached list."""
+        assert "custom" not in factory_state.get_available_publishers()
+
+        factory_state.register_publisher("custom", MockPublisher)
+
+        assert "custom" in factory_state.get_available_publishers()
+
+    def test_register_only_invalidates_its_own_kind(self, factory_state):
+        """Registering a source should keep the processor list cached."""
+        factory_state.get_available_sources()
+        factory_state.get_available_processors()
+
+        factory_state.register_source("custom", MockSource)
+
+        assert "sources" not in factory_state._AVAILABLE_CACHE
+        assert "processors" in factory_state._AVAILABLE_CACHE
+
+    def test_available_lists_are_copies(self, factory_state):
+        """Mutating a returned list should not change the cached names."""
+        factory_state.get_available_sources().append("bogus")
+
+        assert "bogus" not in factory_state.get_available_sources()
+
+
+class TestFactorySourceDispatch:
+    """Tests for create_source name lookup."""
+
+    @pytest.fixture
+    def builtins(self, factory_state, monkeypatch):
+        """Replace the built-in source builders with mocks."""
+        builders = {"emotiv": MagicMock(), "simulated": MagicMock()}
+        monkeypatch.setattr(factory_state, "_BUILTIN_SOURCES", builders)
+        return builders
+
+    @pytest.mark.parametrize("name", ["simulated", "Simulated", "SIMULATED"])
+    def test_builtin_names_are_case_insensitive(self, builtins, name):
+        """Built-in sources should be found whatever the caller's case."""
+        config = MagicMock()
+
+        source = factory.create_source(name, config)
+
+        builtins["simulated"].assert_called_once_with(config)
+        assert source is builtins["simulated"].return_value
+
+    @pytest.mark.parametrize("name", ["mydevice", "MyDevice", "MYDEVICE"])
+    def test_registered_names_are_case_insensitive(self, builtins, name):
+        """Sources registered in mixed case should resolve from any case."""
+        factory.register_source("MyDevice", MockSource)
+
+        source = factory.create_source(name, MagicMock())
+
+        assert isinstance(source, MockSource)
+        assert source.source_id == "mydevice-source"
+
+    def test_registry_keys_are_interned(self, factory_state):
+        """Registered names should be stored lowercase and interned."""
+        name = "".join(["My", "Device"])
+        factory_state.register_source(name, MockSource)
+
+        key = next(k for k in factory_state._SOURCE_REGISTRY if k == "mydevice")
+        assert key is sys.intern("mydevice")
+
+    def test_unknown_source_lists_available_types(self, builtins):
+        """An unknown name should raise ConfigurationError with the choices."""
+        with pytest.raises(ConfigurationError, match="emotiv, simulated"):
+            factory.create_source("Unknown", MagicMock())
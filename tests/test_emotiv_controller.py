@@ -2,9 +2,19 @@ import pytest
 import json
 from unittest.mock import patch, MagicMock
 
+from bcipydummies import emotiv_controller
 from bcipydummies.emotiv_controller import EmotivController
 
 
+@pytest.fixture(autouse=True)
+def fake_win32(monkeypatch):
+    """Sin pywin32 (p. ej. en Linux) win32gui/win32con valen None: se
+    sustituyen por mocks para que los patch de cada test tengan destino."""
+    if emotiv_controller.win32gui is None:
+        monkeypatch.setattr(emotiv_controller, "win32gui", MagicMock())
+        monkeypatch.setattr(emotiv_controller, "win32con", MagicMock())
+
+
 # ===========================================================
 # TESTS UNITARIOS PARA EmotivController
 # ===========================================================
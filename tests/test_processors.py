@@ -214,6 +214,16 @@ class TestThresholdProcessor:
 
         assert result is left_command_event
 
+    def test_mutating_config_in_place_updates_thresholds(
+        self, left_command_event
+    ):
+        """Changes made to the existing config should apply to the next event."""
+        processor = ThresholdProcessor(thresholds={"left": 0.5})
+
+        processor.config.thresholds["left"] = 0.95
+
+        assert processor.process(left_command_event) is None
+
     def test_reset_is_noop(self, left_command_event):
         """Reset should not affect stateless processor behavior."""
         processor = ThresholdProcessor(thresholds={"left": 0.5})
@@ -493,6 +503,39 @@ class TestDebounceProcessor:
         result = processor.process(event)
         assert result is event
 
+    def test_assigning_config_updates_cooldowns(
+        self, left_command_event, mock_time
+    ):
+        """Assigning a new config should take effect on the next event."""
+        time_source = mock_time(initial_time=100.0)
+        processor = DebounceProcessor(cooldown=0.3, time_source=time_source)
+
+        processor.process(left_command_event)
+        processor.config = DebounceConfig(
+            cooldown=0.3,
+            per_command_cooldown={"left": 1.0},
+        )
+        time_source.advance(0.5)
+
+        assert processor.process(left_command_event) is None
+
+    def test_mutating_config_in_place_updates_cooldowns(
+        self, left_command_event, mock_time
+    ):
+        """Changes made to the existing config should apply to the next event."""
+        time_source = mock_time(initial_time=100.0)
+        processor = DebounceProcessor(cooldown=0.3, time_source=time_source)
+
+        processor.process(left_command_event)
+        processor.config.per_command_cooldown["left"] = 5.0
+        time_source.advance(0.5)
+        assert processor.process(left_command_event) is None
+
+        processor.config.per_command_cooldown.clear()
+        processor.config.cooldown = 10.0
+        time_source.advance(1.0)
+        assert processor.process(left_command_event) is None
+
 
 # ===========================================================
 # COMMAND MAPPER TESTS
@@ -722,6 +765,38 @@ class TestCommandMapper:
 
         assert result is None
 
+    def test_assigning_config_updates_actions(
+        self, sample_timestamp, sample_source_id
+    ):
+        """Assigning a new config should take effect on the next event."""
+        mapper = CommandMapper(mapping={"left": "A"})
+        mapper.config = MapperConfig(mapping={"left": "J"})
+
+        event = MentalCommandEvent(
+            timestamp=sample_timestamp,
+            source_id=sample_source_id,
+            command=MentalCommand.LEFT,
+            power=0.9,
+        )
+
+        result = mapper.process(event)
+
+        assert result is not None
+        assert result.action == "J"
+
+    def test_mutating_config_in_place_updates_actions(
+        self, left_command_event
+    ):
+        """Changes made to the existing config should apply to the next event."""
+        mapper = CommandMapper(mapping={"left": "A"})
+
+        mapper.config.mapping["left"] = "J"
+        assert mapper.process(left_command_event).action == "J"
+
+        del mapper.config.mapping["left"]
+        mapper.config.pass_unmapped = False
+        assert mapper.process(left_command_event) is None
+
 
 # ===========================================================
 # PROCESSOR PIPELINE INTEGRATION TESTS
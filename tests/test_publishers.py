@@ -628,6 +628,32 @@ class TestWindowsKeyboardPublisher:
 
             publisher.stop()
 
+    def test_press_key_accepts_vk_code(self, mock_win32gui, mock_win32con):
+        """press_key() should send integer VK codes unchanged."""
+        mock_win32gui.FindWindow = MagicMock(return_value=12345)
+
+        publisher = WindowsKeyboardPublisher(
+            window_name="TestWindow",
+            default_hold_time=0.001,
+        )
+
+        with patch.dict(sys.modules, {
+            "win32gui": mock_win32gui,
+            "win32con": mock_win32con,
+        }):
+            publisher.start()
+
+            publisher.press_key(VK_CODES["SPACE"])
+
+            mock_win32gui.PostMessage.assert_any_call(
+                12345,
+                mock_win32con.WM_KEYDOWN,
+                VK_CODES["SPACE"],
+                0
+            )
+
+            publisher.stop()
+
     def test_press_key_raises_for_unknown_key(self, mock_win32gui, mock_win32con):
         """press_key() should raise ValueError for unknown keys."""
         mock_win32gui.FindWindow = MagicMock(return_value=12345)
@@ -737,6 +763,28 @@ class TestWindowsKeyboardPublisher:
 
             publisher.stop()
 
+    def test_press_keys_unknown_key_sends_nothing(self, mock_win32gui, mock_win32con):
+        """press_keys() should validate every key before sending any."""
+        mock_win32gui.FindWindow = MagicMock(return_value=12345)
+
+        publisher = WindowsKeyboardPublisher(
+            window_name="TestWindow",
+            default_hold_time=0.001,
+        )
+
+        with patch.dict(sys.modules, {
+            "win32gui": mock_win32gui,
+            "win32con": mock_win32con,
+        }):
+            publisher.start()
+
+            with pytest.raises(ValueError, match="Unrecognized key"):
+                publisher.press_keys(["A", "INVALID_KEY"])
+
+            assert mock_win32gui.PostMessage.call_count == 0
+
+            publisher.stop()
+
     def test_context_manager_protocol(self, mock_win32gui, mock_win32con):
         """WindowsKeyboardPublisher should work as context manager."""
         mock_win32gui.FindWindow = MagicMock(return_value=12345)